@@ -1,108 +1,267 @@
 """
 Construct tables ready for printing data into nice table-like output.
 Nested tables, and cells containing multiple lines, are allowed!
-Exports class Table()
+Exports class Table(), StreamingTable() and render_stats()
 """
 
 
+import asyncio
 import copy
-from functools import wraps
-from itertools import zip_longest
+import csv
+import html
+import io
+import json
+import math
+import sys
+import time
+import weakref
+from collections import Counter, deque
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial, wraps
+from itertools import chain, islice, zip_longest
 
-__all__ = ['Table']
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+__all__ = ['Table', 'StreamingTable', 'render_stats']
+
+# Largest integer for which all smaller integers are exact in a float
+_EXACT = 2 ** 53
+# Number of rows rendered at a time by Table.iter_lines
+_BLOCK = 1024
+if np is not None:
+    _POW10 = np.array([10.0 ** k for k in range(1, 17)])
+# The _RenderStats recording, inside a render_stats() block
+_stats = None
+
+
+class _RenderStats:
+    """
+    Counts and cumulative times (seconds) of rendering, see render_stats.
+    Times are inclusive: the time of a nested Table is also part of the
+    trunk time of its cell, and of the column_widths of its owner.
+    """
+
+    def __init__(self):
+        self.counts = {
+            'column_widths': 0, 'column_widths_time': 0.0,
+            'trunk': 0, 'trunk_time': 0.0,
+            'nested': 0, 'nested_time': 0.0,
+            'cache_hits': 0, 'cache_misses': 0,
+            'lines': 0, 'bytes': 0,
+        }
+        # Depth of nested Tables being rendered
+        self.depth = 0
+
+    @contextmanager
+    def timed(self, name):
+        """Counts a call of name, and adds its time to name_time."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.counts[name] += 1
+            self.counts[name + '_time'] += time.perf_counter() - start
+
+    def output(self, lines):
+        """Counts the lines (and their bytes) of the rendered output."""
+        if self.depth > 0:
+            yield from lines
+            return
+        for line in lines:
+            self.counts['lines'] += 1
+            self.counts['bytes'] += len(line.encode()) + 1
+            yield line
+
+
+@contextmanager
+def render_stats(callback=None):
+    """
+    Records statistics of all tables rendered in the with block, as a
+    dict of counts and cumulative times (seconds):
+    column_widths(_time)    -- Computations of the column widths.
+    trunk(_time)            -- Cells trunked and rendered (Cell._trunk).
+    nested(_time)           -- Nested Tables rendered.
+    cache_hits/misses       -- Cells rendered from their kept lines, or
+                               rendered again.
+    lines/bytes             -- Output of str(), render(), render_to(), ...
+                               (utf-8 bytes, including newlines).
+    Not recorded outside the block, nor in the workers of
+    render(workers=...).
+    Keyword arguments:
+    callback    -- Called with the dict at the end of the block, e.g. for
+                   sending it as metrics (default None).
+    Usage:
+        with render_stats() as stats:
+            print(T)
+        stats['trunk_time']
+    """
+    global _stats
+    previous, _stats = _stats, _RenderStats()
+    stats = _stats
+    try:
+        yield stats.counts
+    finally:
+        _stats = previous
+        if callback is not None:
+            callback(stats.counts)
 
 
 class _Cell:
     """
     Generates objects for the Table class. Each Table is a
     two-dimensional row containing Cell-objects.
+    The fill of a cell is read from its owner (Table or column), the
+    max_width is given when trunking, so neither is stored per cell.
+    The rendered lines and width of plain values (str, int, float or
+    empty) are kept until the value is set again, the lines of a nested
+    Table until that Table changes.
     """
 
-    def __init__(self, value, max_width=None, fill=None):
-        """Set value and calculates the max_width and height."""
+    __slots__ = ('_value', '_owner', '_lines', '_width')
+
+    def __init__(self, value, owner=None):
+        """Set value and the owner of this cell."""
+        self._owner = None
         self.value = value
-        self.max_width = max_width
-        self.fill = fill
+        self.owner = owner
 
     def __repr__(self):
         """Representation of this object."""
         return f'<Cell object: value=`{self.value}`>'
 
+    def __getstate__(self):
+        return {k: getattr(self, k) for k in self.__slots__}
+
+    def __setstate__(self, state):
+        """Nested Tables notify the owner again, after unpickling."""
+        for k, v in state.items():
+            setattr(self, k, v)
+        self.owner = self._owner
+
     def __str__(self):
-        """
-        Trunks the value according to the set max_width,
-        and returns a string repressentation.
-        """
-        v = self._trunk()
-        return str(v)
+        """Returns a string repressentation of the (untrunked) value."""
+        return '\n'.join(self.lines())
 
     def __len__(self):
         """Returns the total width of this cell (before trunking)."""
-        if isinstance(self.value, Table):
-            return len(self.value)
-        else:
+        if isinstance(self._value, Table):
+            return len(self._value)
+        if not self._cached():
             return max(len(v) for v in str(self.value).split('\n'))
+        fill = self.fill
+        if self._width is None or self._width[0] != fill:
+            width = max(len(v) for v in str(self.value).split('\n'))
+            self._width = (fill, width)
+        return self._width[1]
 
     def __iter__(self):
-        """Iterate over each trunked row of cells value."""
-        v = self._trunk()
-        for line in str(v).split('\n'):
-            yield line
+        """Iterate over each (untrunked) row of cells value."""
+        yield from self.lines()
+
+    def lines(self, max_width=None):
+        """Returns a list of the rows of the value, trunked to max_width."""
+        if not self._cached():
+            return self._render(max_width)
+        key = self._key(max_width)
+        if self._lines is None or self._lines[0] != key:
+            lines = self._render(max_width)
+            # Trunking a Table sets its fill and max_width
+            self._lines = (self._key(max_width), lines)
+        elif _stats is not None:
+            _stats.counts['cache_hits'] += 1
+        return self._lines[1]
+
+    def _render(self, max_width):
+        """The lines of the trunked value, recorded in render_stats."""
+        if _stats is None:
+            return str(self._trunk(max_width)).split('\n')
+        stats = _stats
+        stats.counts['cache_misses'] += 1
+        with stats.timed('trunk'):
+            v = self._trunk(max_width)
+            if not isinstance(v, Table):
+                return str(v).split('\n')
+            stats.depth += 1
+            try:
+                with stats.timed('nested'):
+                    return str(v).split('\n')
+            finally:
+                stats.depth -= 1
+
+    def _key(self, max_width):
+        """
+        The rendered lines are kept for this key. A nested Table counts
+        its changes, including changes of the Tables nested in it.
+        """
+        if isinstance(self._value, Table):
+            return (max_width, self.fill, self._value._version)
+        return (max_width, self.fill)
+
+    def _cached(self):
+        """
+        Only values which can't change in place, or notify their changes
+        (Tables), are kept rendered.
+        """
+        return isinstance(self._value, (str, int, float, type(None), Table))
 
     @property
     def value(self):
         if self._value is None:
-            return self._fill
+            return self.fill
         else:
             return self._value
 
     @value.setter
     def value(self, value):
         self._value = value
+        self._lines = None
+        self._width = None
+        if self._owner is not None:
+            if isinstance(value, Table):
+                value._parents.add(self._owner)
+            self._owner._changed()
 
     @property
-    def fill(self):
-        return self._fill
+    def owner(self):
+        return self._owner
 
-    @fill.setter
-    def fill(self, value):
-        if value is None:
-            value = ''
-        self._fill = str(value)
+    @owner.setter
+    def owner(self, owner):
+        """
+        Sets the Table (or column of a Table) this Cell belongs to.
+        The owner is notified when the cell changes.
+        """
+        self._owner = owner
+        if owner is not None and isinstance(self._value, Table):
+            self._value._parents.add(owner)
 
     @property
-    def max_width(self):
-        return self._max_width
-
-    @max_width.setter
-    def max_width(self, value):
-        """Sets the maximum width of this Cell."""
-        if value is None:
-            self._max_width = value
-            return
-        try:
-            if value > 2:
-                self._max_width = value
-            else:
-                raise ValueError('`max_width` cannot be less then 3')
-        except TypeError:
-            raise TypeError('`max_width` should be an integer or `None`')
+    def fill(self):
+        """Returns the fill of the owner, used when the value is None."""
+        if self._owner is None:
+            return ''
+        return str(self._owner.fill)
 
-    def copy(self):
+    def copy(self, owner=None):
         """Copies and return data from cell."""
         if isinstance(self.value, (int, float, str)):
-            return _Cell(value=self.value, max_width=self.max_width)
+            return _Cell(value=self.value, owner=owner)
         elif isinstance(self.value, (list, dict, tuple, object)):
-            return _Cell(value=copy.deepcopy(self.value),
-                         max_width=self.max_width)
+            return _Cell(value=copy.deepcopy(self.value), owner=owner)
 
-    def _trunk(self):
+    def _trunk(self, max_width=None):
         """
         Trunks the value in the cell before printing.
         Adds newline chars where possible.
         """
+        if max_width is not None and max_width < 3:
+            raise ValueError('`max_width` cannot be less then 3')
         v = self.value
-        i = self.max_width
+        i = max_width
         if v is None:
             v = self.fill
         elif isinstance(v, Table):
@@ -110,28 +269,16 @@ class _Cell:
             v.max_width = i
         elif isinstance(v, list):
             v = str(v)
-        elif isinstance(v, float):
-            if i is not None:
-                r = i - len(str(round(v))) - 2
-                if r > 0:
-                    v = round(v, r)
-                else:
-                    v = int(v)
-            else:
-                v = str(v)
-        # If, not elif, because float still needs to be trunked!
-        if isinstance(v, int) and i is not None:
-            if i is not None and len(str(round(v))) > i:
-                counter = 0
-                while len(str(round(v))) > i - len(str(counter)) - 1:
-                    v = float(v) / 10
-                    counter += 1
-                v = int(v)
-                v = str(v) + 'e' + str(counter)
-            else:
-                v = str(v)
+        else:
+            v = _trunk_number(v, i)
+        return self._wrap(v, i)
 
-        # If, not elif,
+    def _wrap(self, v, max_width):
+        """
+        Trunks a string value, after _trunk_number.
+        Adds newline chars where possible.
+        """
+        i = max_width
         # Tries to devide list (containing spaces) in multiple rows
         # Also further trunks integer after 'e' if needed
         if isinstance(v, str):
@@ -154,6 +301,1095 @@ class _Cell:
                     v = line
         return v
 
+    def _set_number(self, max_width, v):
+        """Keeps the lines of a number trunked by _format_numbers."""
+        v = self._wrap(v, max_width)
+        self._lines = (self._key(max_width), str(v).split('\n'))
+
+
+def _trunk_number(v, i):
+    """Trunks a float or an int to i chars (None: not trunked)."""
+    if isinstance(v, float):
+        if i is not None:
+            r = i - len(str(round(v))) - 2
+            if r > 0:
+                v = round(v, r)
+            else:
+                v = int(v)
+        else:
+            v = str(v)
+    # If, not elif, because float still needs to be trunked!
+    if isinstance(v, int) and i is not None:
+        if len(str(round(v))) > i:
+            counter = 0
+            while len(str(round(v))) > i - len(str(counter)) - 1:
+                v = float(v) / 10
+                counter += 1
+            v = int(v)
+            v = str(v) + 'e' + str(counter)
+        else:
+            v = str(v)
+    return v
+
+
+def _digits(a):
+    """Returns the length of str(round(x)) for each x of a NumPy array."""
+    r = np.rint(a)
+    return (1 + np.searchsorted(_POW10, np.abs(r), side='right')
+            + (r < 0))
+
+
+def _format_numbers(values, i):
+    """
+    Trunks a list of floats and ints to i chars, same as _trunk_number
+    on each value. With NumPy the digit counts, rounding precision and
+    e-notation are computed for all values at once.
+    """
+    if np is None or i is None:
+        return [_trunk_number(v, i) for v in values]
+    out = list(values)
+    floats = []
+    # Indices and values for the int part of _trunk_number
+    ints = []
+    n = []
+    for k, v in enumerate(values):
+        # Bools, big and non-finite numbers are not exact in a float64
+        if type(v) not in (int, float) or not abs(v) < _EXACT:
+            out[k] = _trunk_number(v, i)
+        elif type(v) is float:
+            floats.append(k)
+        else:
+            ints.append(k)
+            n.append(v)
+    if floats:
+        f = np.array([values[k] for k in floats], dtype=float)
+        r = i - _digits(f) - 2
+        for k, v, p in zip(floats, f.tolist(), r.tolist()):
+            if p > 0:
+                out[k] = round(v, p)
+            else:
+                ints.append(k)
+                n.append(int(v))
+    if not ints:
+        return out
+    ints = np.array(ints)
+    n = np.array(n, dtype=float)
+    short = _digits(n) <= i
+    for k, v in zip(ints[short].tolist(), n[short].tolist()):
+        out[k] = str(int(v))
+    v = n[~short]
+    counter = np.zeros(len(v), dtype=int)
+    todo = _digits(v) > i - _digits(counter) - 1
+    while todo.any():
+        v[todo] /= 10
+        counter[todo] += 1
+        todo = _digits(v) > i - _digits(counter) - 1
+    for k, x, c in zip(ints[~short].tolist(), np.trunc(v).tolist(),
+                       counter.tolist()):
+        out[k] = f'{int(x)}e{c}'
+    return out
+
+
+class _Layout:
+    """
+    Keeps the column widths of a Table. The natural (untrunked) width of
+    each column is computed once, and kept until the Table changes.
+    With width_strategy 'sample', only the first sample_size rows are
+    measured, and wider cells in the other rows are trunked.
+    """
+
+    def __init__(self, table):
+        self._table = table
+        self.invalidate()
+
+    def invalidate(self, natural=True):
+        """
+        Forget the computed widths. When natural is False, only the widths
+        derived from the natural widths (col_sep, max_width) are dropped.
+        """
+        if natural:
+            self._natural = None
+        self._widths = None
+
+    def add_rows(self, rows):
+        """
+        Widen the natural widths for rows added to the Table, instead of
+        computing them again. Forgets them when the number of columns
+        changed.
+        """
+        natural = self._natural
+        if self._table.width_strategy == 'sample':
+            # Rows past the sample are trunked to the estimated widths,
+            # unless they add columns
+            if natural is not None and \
+                    any(len(row) != len(natural) for row in rows):
+                self.invalidate()
+            return
+        if natural is not None:
+            for row in rows:
+                if len(row) != len(natural):
+                    self._natural = None
+                    break
+                for j, c in enumerate(row):
+                    n = len(c)
+                    if n > natural[j]:
+                        natural[j] = n
+        self._widths = None
+
+    @property
+    def natural(self):
+        """Return a list of the widest cell of each column."""
+        if self._natural is None:
+            T = self._table
+            limit = None
+            if T.width_strategy == 'sample':
+                limit = T.sample_size
+            rows = len(T._data) if limit is None else min(len(T._data),
+                                                          limit)
+            if T.width_workers is not None and \
+                    rows * T._data.width >= T.width_threshold:
+                self._natural = _parallel_widths(T, limit)
+            else:
+                self._natural = T._data.widths(limit)
+            # Add head when calculating max-widths?
+            if T._head is not None:
+                head = [len(c) for c in T._head]
+                if T.row_count == 0:
+                    self._natural = head
+                else:
+                    self._natural = [max(h, n) for h, n
+                                     in zip(head, self._natural)]
+        return self._natural
+
+    @property
+    def widths(self):
+        """Return a list of column widths, trunked to the max_width."""
+        if self._widths is None:
+            if _stats is None:
+                self._widths = self._compute()
+            else:
+                with _stats.timed('column_widths'):
+                    self._widths = self._compute()
+        return self._widths
+
+    def _compute(self):
+        """Computes the widths, from the natural widths."""
+        T = self._table
+        # One space extra...
+        extra = len(T.col_sep) - 1
+        M = [max(n + extra, 3) for n in self.natural]
+        # The last column needs to be smaller
+        # Only if col_sep is set
+        if len(M) > 0 and M[-1] > 3:
+            M[-1] -= extra
+        if T.max_width is not None:
+            # Trunk the width of each column
+            # Starting with the largest column
+            # Remove the seperators for the Cell's max-width
+            col_max = T.max_width - len(T.col_sep) * (len(M) - 1)
+            excess = math.ceil(sum(M) - col_max)
+            # Columns with the lowest priority are trunked first
+            floors = [float('-inf')] * len(M)
+            for j, m in enumerate(T.min_widths or []):
+                if j < len(M) and m is not None:
+                    floors[j] = m
+            priorities = [0] * len(M)
+            for j, p in enumerate(T.priorities or []):
+                if j < len(M) and p is not None:
+                    priorities[j] = p
+            # Only the last columns are trunked to less then 3
+            levels = sorted(set(priorities))
+            for p in levels:
+                columns = [j for j in range(len(M)) if priorities[j] == p]
+                if p != levels[-1]:
+                    floors = [max(f, 3) for f in floors]
+                excess = _shrink(M, excess, columns, floors)
+        return M
+
+
+def _pool(workers):
+    """
+    A pool of workers processes, or threads when Python runs without the
+    GIL.
+    """
+    if workers < 1:
+        raise ValueError('`workers` cannot be less then 1')
+    if getattr(sys, '_is_gil_enabled', lambda: True)():
+        return ProcessPoolExecutor(workers)
+    return ThreadPoolExecutor(workers)
+
+
+def _blocks(rows, limit=None):
+    """The values of the cells of rows, a list of _BLOCK rows at a time."""
+    rows = islice(rows, limit)
+    return iter(lambda: [[c._value for c in row]
+                         for row in islice(rows, _BLOCK)], [])
+
+
+def _block_widths(fill, rows):
+    """The natural widths of rows of values, in a worker."""
+    T = Table(fill=fill)
+    T.extend_rows(rows)
+    return T._data.widths()
+
+
+def _parallel_widths(table, limit=None):
+    """
+    The natural widths of the first limit rows (None: all rows) of a
+    Table, measured a block of rows at a time by table.width_workers.
+    """
+    natural = []
+    measure = partial(_block_widths, table._fill)
+    with _pool(table.width_workers) as pool:
+        for widths in pool.map(measure, _blocks(table._data, limit)):
+            natural = [max(a, b) for a, b
+                       in zip_longest(natural, widths, fillvalue=0)]
+    return natural
+
+
+def _shrink(M, excess, columns, floors):
+    """
+    Trunks the widths M of the columns by excess, the widest column
+    first. Same as trunking the first widest column by one until done,
+    but the level all wider columns are trunked to is found by a binary
+    search. Columns are not trunked below their floor.
+    Returns the excess left when all columns are at their floor.
+    """
+    if excess <= 0 or not columns:
+        return excess
+    floor = {j: min(floors[j], M[j]) for j in columns}
+
+    def cut(level):
+        return sum(M[j] - max(floor[j], min(M[j], level)) for j in columns)
+    low = min(M[j] for j in columns) - excess - 1
+    if cut(low) <= excess:
+        excess -= cut(low)
+        for j in columns:
+            M[j] = max(floor[j], min(M[j], low))
+        return excess
+    # The lowest level for which cut(level) <= excess
+    high = max(M[j] for j in columns)
+    while high - low > 1:
+        mid = (low + high) // 2
+        if cut(mid) <= excess:
+            high = mid
+        else:
+            low = mid
+    excess -= cut(high)
+    for j in columns:
+        wide = M[j] >= high and floor[j] < high
+        M[j] = max(floor[j], min(M[j], high))
+        if wide and excess > 0:
+            M[j] -= 1
+            excess -= 1
+    return 0
+
+
+class _FixedLayout(_Layout):
+    """
+    Column widths which are set once, and don't follow the cells of the
+    Table (see StreamingTable).
+    """
+
+    def __init__(self, table, widths):
+        super().__init__(table)
+        self._natural = self._widths = list(widths)
+
+    def invalidate(self, natural=True):
+        pass
+
+    def add_rows(self, rows):
+        pass
+
+
+def _deletion(indices, length):
+    """
+    Returns the rows to remove of a store of length rows: a slice when
+    they are consecutive, which is deleted at once, else a set.
+    """
+    if isinstance(indices, range) and indices.step == 1:
+        return slice(indices.start, indices.stop)
+    remove = set(indices)
+    if remove and len(remove) == max(remove) - min(remove) + 1 \
+            and min(remove) >= 0:
+        return slice(min(remove), max(remove) + 1)
+    return remove
+
+
+class _RowStore:
+    """
+    Stores the cells of a Table as a list of rows (default storage).
+    All rows contain an equal number of cells.
+    """
+
+    def __init__(self, table, rows=()):
+        self._table = table
+        self._rows = []
+        for row in rows:
+            self.insert_row(len(self._rows), row)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __getitem__(self, index):
+        return self._rows[index]
+
+    @property
+    def width(self):
+        """Returns the number of cells in each row."""
+        return len(self._rows[0]) if self._rows else 0
+
+    def cells(self):
+        for row in self._rows:
+            yield from row
+
+    def columns(self):
+        return zip(*self._rows)
+
+    def column(self, index):
+        return [row[index] for row in self._rows]
+
+    def cell(self, i, j):
+        return self._rows[i][j]
+
+    def widths(self, limit=None):
+        """
+        Returns a list of the widest cell of each column, in the first
+        limit rows (default None: all rows).
+        """
+        rows = self._rows if limit is None else self._rows[:limit]
+        return [max(len(c) for c in column) for column in zip(*rows)]
+
+    def resize(self, width):
+        """Adds empty cells to the end of each row, up to width cells."""
+        if width > self.width:
+            self._pad(self._rows, width)
+
+    def _pad(self, rows, width):
+        new = self._table._new_cell
+        for row in rows:
+            if len(row) < width:
+                row.extend(new() for __ in range(width - len(row)))
+
+    def insert_row(self, index, cells):
+        """Inserts a row of cells. Rows are padded to an equal length."""
+        cells = list(cells)
+        if self._rows and len(cells) > self.width:
+            self.resize(len(cells))
+        new = self._table._new_cell
+        cells.extend(new() for __ in range(self.width - len(cells)))
+        self._rows.insert(index, cells)
+
+    def extend_rows(self, rows):
+        """Appends rows of cells. Pads all rows once, at the end."""
+        rows = [list(row) for row in rows]
+        width = self.width
+        new_width = max((len(row) for row in rows), default=0)
+        self._rows.extend(rows)
+        if new_width > width:
+            self._pad(self._rows, new_width)
+        else:
+            self._pad(rows, width)
+
+    def insert_column(self, index, cells):
+        """Inserts a column of cells. Adds rows when cells don't fit."""
+        self.insert_columns(index, [cells])
+
+    def insert_columns(self, index, columns):
+        """
+        Inserts columns of cells before index, in one pass over the rows.
+        Adds rows when cells don't fit.
+        """
+        new = self._table._new_cell
+        columns = [list(cells) for cells in columns]
+        if not columns:
+            return
+        width = self.width
+        while len(self._rows) < max(len(cells) for cells in columns):
+            self._rows.append([new() for __ in range(width)])
+        for cells in columns:
+            cells.extend(new() for __ in range(len(self._rows) - len(cells)))
+        for row, cells in zip(self._rows, zip(*columns)):
+            row[index:index] = cells
+
+    def remove_rows(self, indices):
+        """
+        Removes the rows at the given indices, in a single pass over the
+        rows (see _deletion).
+        """
+        remove = _deletion(indices, len(self._rows))
+        if isinstance(remove, slice):
+            del self._rows[remove]
+        else:
+            self._rows = [r for i, r in enumerate(self._rows)
+                          if i not in remove]
+
+    def remove_columns(self, indices):
+        """Removes the columns at the given indices."""
+        remove = set(indices)
+        for row in self._rows:
+            row[:] = [c for j, c in enumerate(row) if j not in remove]
+
+    def clear_column(self, index):
+        """Replaces the cells of a column by empty cells."""
+        new = self._table._new_cell
+        for row in self._rows:
+            row[index] = new()
+
+
+class _Column:
+    """
+    A column of the _ColumnStore. The cells of the column report their
+    changes to the column, which keeps the natural width of its cells
+    until then, or until the fill of the table changes.
+    """
+
+    __slots__ = ('table', 'cells', '_width', '__weakref__')
+
+    def __init__(self, table, cells):
+        self.table = table
+        self.cells = cells
+        self._width = None
+        for cell in cells:
+            cell.owner = self
+
+    @property
+    def width(self):
+        """Returns the width of the widest cell in the column."""
+        fill = self.table.fill
+        if self._width is None or self._width[0] != fill:
+            width = max((len(c) for c in self.cells), default=0)
+            self._width = (fill, width)
+        return self._width[1]
+
+    @property
+    def fill(self):
+        return self.table.fill
+
+    def insert(self, index, cell):
+        cell.owner = self
+        self.cells.insert(index, cell)
+        if self._width is not None:
+            fill, width = self._width
+            self._width = (fill, max(width, len(cell)))
+
+    def extend(self, cells):
+        for cell in cells:
+            cell.owner = self
+        self.cells.extend(cells)
+        if self._width is not None:
+            fill, width = self._width
+            self._width = (fill, max([width, *(len(c) for c in cells)]))
+
+    def _changed(self, natural=True):
+        if natural:
+            self._width = None
+        self.table._changed(natural)
+
+
+class _ColumnStore:
+    """
+    Stores the cells of a Table as a list of columns (storage='columnar').
+    Inserting or removing a column only touches that column, and the
+    natural width of each column is kept until one of its cells changes.
+    """
+
+    def __init__(self, table, rows=()):
+        self._table = table
+        self._columns = []
+        self._length = 0
+        for row in rows:
+            self.insert_row(self._length, row)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        columns = [column.cells for column in self._columns]
+        for i in range(self._length):
+            yield [cells[i] for cells in columns]
+
+    def __getitem__(self, index):
+        if not -self._length <= index < self._length:
+            raise IndexError('Row index out of range')
+        return [column.cells[index] for column in self._columns]
+
+    @property
+    def width(self):
+        """Returns the number of columns."""
+        return len(self._columns)
+
+    def cells(self):
+        for row in self:
+            yield from row
+
+    def columns(self):
+        for column in self._columns:
+            yield tuple(column.cells)
+
+    def column(self, index):
+        return list(self._columns[index].cells)
+
+    def cell(self, i, j):
+        return self._columns[j].cells[i]
+
+    def widths(self, limit=None):
+        """
+        Returns a list of the widest cell of each column, in the first
+        limit rows (default None: all rows).
+        """
+        if limit is None or limit >= self._length:
+            return [column.width for column in self._columns]
+        return [max((len(c) for c in islice(column.cells, limit)), default=0)
+                for column in self._columns]
+
+    def resize(self, width):
+        """Adds columns of empty cells, up to width columns."""
+        if self._length == 0:
+            return
+        self._add_columns(width)
+
+    def _add_columns(self, width):
+        new = self._table._new_cell
+        while len(self._columns) < width:
+            cells = [new() for __ in range(self._length)]
+            self._columns.append(_Column(self._table, cells))
+
+    def insert_row(self, index, cells):
+        """Inserts a row of cells. Rows are padded to an equal length."""
+        cells = list(cells)
+        if len(cells) > len(self._columns):
+            self._add_columns(len(cells))
+        new = self._table._new_cell
+        cells.extend(new() for __ in range(len(self._columns) - len(cells)))
+        for column, cell in zip(self._columns, cells):
+            column.insert(index, cell)
+        self._length += 1
+
+    def extend_rows(self, rows):
+        """Appends rows of cells. Pads all rows once, at the end."""
+        rows = [list(row) for row in rows]
+        if not rows:
+            return
+        if self._length == 0:
+            self._columns = []
+        self._add_columns(max(len(row) for row in rows))
+        new = self._table._new_cell
+        for j, column in enumerate(self._columns):
+            column.extend([row[j] if j < len(row) else new()
+                           for row in rows])
+        self._length += len(rows)
+
+    def insert_column(self, index, cells):
+        """Inserts a column of cells. Adds rows when cells don't fit."""
+        self.insert_columns(index, [cells])
+
+    def insert_columns(self, index, columns):
+        """
+        Inserts columns of cells before index, without touching the other
+        columns. Adds rows when cells don't fit.
+        """
+        new = self._table._new_cell
+        columns = [list(cells) for cells in columns]
+        if not columns:
+            return
+        length = max(len(cells) for cells in columns)
+        if length > self._length:
+            for column in self._columns:
+                column.extend([new() for __ in range(length - self._length)])
+            self._length = length
+        for cells in columns:
+            cells.extend(new() for __ in range(self._length - len(cells)))
+        self._columns[index:index] = [_Column(self._table, cells)
+                                      for cells in columns]
+
+    def remove_rows(self, indices):
+        """
+        Removes the rows at the given indices, in a single pass over each
+        column (see _deletion).
+        """
+        remove = _deletion(indices, self._length)
+        for column in self._columns:
+            if isinstance(remove, slice):
+                del column.cells[remove]
+            else:
+                column.cells = [c for i, c in enumerate(column.cells)
+                                if i not in remove]
+            column._width = None
+        if isinstance(remove, slice):
+            self._length -= len(range(*remove.indices(self._length)))
+        else:
+            self._length -= len([i for i in remove
+                                 if 0 <= i < self._length])
+        if self._length == 0:
+            self._columns = []
+
+    def remove_columns(self, indices):
+        """Removes the columns at the given indices."""
+        remove = set(indices)
+        self._columns = [c for j, c in enumerate(self._columns)
+                         if j not in remove]
+
+    def clear_column(self, index):
+        """Replaces the cells of a column by empty cells."""
+        if self._length == 0:
+            return
+        new = self._table._new_cell
+        cells = [new() for __ in range(self._length)]
+        self._columns[index] = _Column(self._table, cells)
+
+
+class _ViewStore:
+    """
+    Shows rows and columns of the storage of another Table, without
+    copying the cells (see Table.view). Read-only.
+    """
+
+    def __init__(self, store, rows=None, columns=None):
+        self._store = store
+        self._rows = rows
+        self._columns = columns
+
+    def __len__(self):
+        if self._rows is None:
+            return len(self._store)
+        return len(self._rows)
+
+    def __iter__(self):
+        if self._columns is None:
+            rows = self._store if self._rows is None else (
+                self._store[i] for i in self._rows)
+            for row in rows:
+                yield list(row)
+        else:
+            rows = range(len(self._store)) if self._rows is None \
+                else self._rows
+            cell = self._store.cell
+            for i in rows:
+                yield [cell(i, j) for j in self._columns]
+
+    def __getitem__(self, index):
+        if self._rows is not None:
+            index = self._rows[index]
+        if self._columns is None:
+            return list(self._store[index])
+        return [self._store.cell(index, j) for j in self._columns]
+
+    @property
+    def width(self):
+        """Returns the number of cells in each row."""
+        if len(self) == 0:
+            return 0
+        if self._columns is None:
+            return self._store.width
+        return len(self._columns)
+
+    def cells(self):
+        for row in self:
+            yield from row
+
+    def columns(self):
+        return zip(*self)
+
+    def column(self, index):
+        return [row[index] for row in self]
+
+    def cell(self, i, j):
+        if self._rows is not None:
+            i = self._rows[i]
+        if self._columns is not None:
+            j = self._columns[j]
+        return self._store.cell(i, j)
+
+    def widths(self, limit=None):
+        """
+        Returns a list of the widest cell of each column, in the first
+        limit rows (default None: all rows).
+        """
+        if self._rows is None:
+            W = self._store.widths(limit)
+            if self._columns is None:
+                return W
+            return [W[j] for j in self._columns]
+        return [max(len(c) for c in column)
+                for column in zip(*islice(self, limit))]
+
+    def resize(self, width):
+        pass
+
+
+class _RingRow:
+    """
+    A row of the _RingStore. The cells of the row report their changes
+    to the row, which counts their widths again.
+    """
+
+    __slots__ = ('store', 'cells', 'widths', '__weakref__')
+
+    def __init__(self, store, cells):
+        self.store = store
+        self.cells = cells
+        self.widths = None
+        for cell in cells:
+            cell.owner = self
+
+    @property
+    def fill(self):
+        return self.store._table.fill
+
+    def _changed(self, natural=True):
+        if natural and self.widths is not None:
+            self.store._uncount(self)
+            self.store._count(self)
+        self.store._table._changed(natural)
+
+
+class _RingStore:
+    """
+    Stores the last max_rows rows of a Table in a deque (storage='ring',
+    see Table(max_rows=...)). Adding rows evicts the oldest rows. The
+    natural width of each column is kept as a histogram of the widths of
+    its cells: evicting the widest row only looks at the other widths,
+    not at the other rows.
+    """
+
+    def __init__(self, table, rows=()):
+        self._table = table
+        self._rows = deque()
+        # Number of cells of each width, and the widest (None: unknown)
+        self._hist = []
+        self._max = []
+        self._fill = table.fill
+        for row in rows:
+            self.insert_row(len(self._rows), row)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __iter__(self):
+        return (row.cells for row in self._rows)
+
+    def __getitem__(self, index):
+        return self._rows[index].cells
+
+    @property
+    def width(self):
+        """Returns the number of cells in each row."""
+        return len(self._rows[0].cells) if self._rows else 0
+
+    def cells(self):
+        for row in self._rows:
+            yield from row.cells
+
+    def columns(self):
+        return zip(*self)
+
+    def column(self, index):
+        return [row.cells[index] for row in self._rows]
+
+    def cell(self, i, j):
+        return self._rows[i].cells[j]
+
+    def widths(self, limit=None):
+        """
+        Returns a list of the widest cell of each column, in the first
+        limit rows (default None: all rows).
+        """
+        if limit is not None and limit < len(self._rows):
+            return [max(len(c) for c in column)
+                    for column in zip(*islice(self, limit))]
+        if self._fill != self._table.fill:
+            # Empty cells are as wide as the fill
+            self._recount()
+        for j, m in enumerate(self._max):
+            if m is None:
+                self._max[j] = max(self._hist[j], default=0)
+        return list(self._max)
+
+    def _count(self, row):
+        """Adds the widths of the cells of a row to the histograms."""
+        row.widths = [len(c) for c in row.cells]
+        for j, w in enumerate(row.widths):
+            self._hist[j][w] += 1
+            if self._max[j] is not None and w > self._max[j]:
+                self._max[j] = w
+
+    def _uncount(self, row):
+        """Removes the widths of the cells of a row from the histograms."""
+        for j, w in enumerate(row.widths):
+            hist = self._hist[j]
+            hist[w] -= 1
+            if hist[w] == 0:
+                del hist[w]
+                if w == self._max[j]:
+                    self._max[j] = None
+
+    def _recount(self):
+        """Counts the widths of all cells, after the columns changed."""
+        self._fill = self._table.fill
+        self._hist = [Counter() for __ in range(self.width)]
+        self._max = [0] * self.width
+        for row in self._rows:
+            self._count(row)
+
+    def _evict(self, keep=None):
+        """
+        Removes the oldest rows, down to max_rows rows. The row keep (just
+        inserted) is never evicted, the row after it is.
+        """
+        while len(self._rows) > self._table.max_rows:
+            row = self._rows.popleft()
+            if row is keep:
+                self._uncount(self._rows.popleft())
+                self._rows.appendleft(row)
+            else:
+                self._uncount(row)
+
+    def resize(self, width):
+        """Adds empty cells to the end of each row, up to width cells."""
+        if width > self.width:
+            new = self._table._new_cell
+            for row in self._rows:
+                cells = [new() for __ in range(width - len(row.cells))]
+                for cell in cells:
+                    cell.owner = row
+                row.cells.extend(cells)
+            self._recount()
+
+    def insert_row(self, index, cells):
+        """
+        Inserts a row of cells, and evicts the oldest row when there are
+        more than max_rows rows. Rows are padded to an equal length.
+        """
+        cells = list(cells)
+        if self._rows and len(cells) > self.width:
+            self.resize(len(cells))
+        new = self._table._new_cell
+        cells.extend(new() for __ in range(self.width - len(cells)))
+        row = _RingRow(self, cells)
+        self._rows.insert(index, row)
+        if len(self._hist) != len(cells):
+            self._recount()
+        else:
+            self._count(row)
+        self._evict(keep=row)
+
+    def extend_rows(self, rows):
+        """Appends rows of cells, evicting the oldest rows."""
+        for cells in rows:
+            self.insert_row(len(self._rows), cells)
+
+    def insert_column(self, index, cells):
+        """Inserts a column of cells. Adds rows when cells don't fit."""
+        self.insert_columns(index, [cells])
+
+    def insert_columns(self, index, columns):
+        """
+        Inserts columns of cells before index, in one pass over the rows.
+        Adds rows when cells don't fit.
+        """
+        new = self._table._new_cell
+        columns = [list(cells) for cells in columns]
+        if not columns:
+            return
+        width = self.width
+        while len(self._rows) < max(len(cells) for cells in columns):
+            self._rows.append(_RingRow(self, [new() for __ in range(width)]))
+        for cells in columns:
+            cells.extend(new() for __ in range(len(self._rows) - len(cells)))
+        for row, cells in zip(self._rows, zip(*columns)):
+            for cell in cells:
+                cell.owner = row
+            row.cells[index:index] = cells
+        self._recount()
+        self._evict()
+
+    def remove_rows(self, indices):
+        """
+        Removes the rows at the given indices. Removing the oldest rows
+        (see _deletion) only touches those rows.
+        """
+        remove = _deletion(indices, len(self._rows))
+        if isinstance(remove, slice) and remove.start == 0:
+            for __ in range(min(remove.stop, len(self._rows))):
+                self._uncount(self._rows.popleft())
+        else:
+            if isinstance(remove, slice):
+                remove = set(range(*remove.indices(len(self._rows))))
+            rows = deque()
+            for i, row in enumerate(self._rows):
+                if i in remove:
+                    self._uncount(row)
+                else:
+                    rows.append(row)
+            self._rows = rows
+        if not self._rows:
+            # No columns left to measure
+            self._hist = []
+            self._max = []
+
+    def remove_columns(self, indices):
+        """Removes the columns at the given indices."""
+        remove = set(indices)
+        for row in self._rows:
+            row.cells[:] = [c for j, c in enumerate(row.cells)
+                            if j not in remove]
+        self._recount()
+
+    def clear_column(self, index):
+        """Replaces the cells of a column by empty cells."""
+        new = self._table._new_cell
+        for row in self._rows:
+            cell = new()
+            cell.owner = row
+            row.cells[index] = cell
+        self._recount()
+
+
+_STORAGES = {
+    'rows': _RowStore,
+    'columnar': _ColumnStore,
+    'ring': _RingStore,
+}
+
+
+def _render_rows(settings, widths, rows):
+    """
+    Renders rows of values with the given column widths, without a head
+    or the row seperators before the first row. Runs in the workers of
+    Table.render(workers=...).
+    """
+    T = Table(**settings)
+    T.extend_rows(rows)
+    T._layout = _FixedLayout(T, widths)
+    return list(T._iter_lines(T._data))
+
+
+def _render_text(table):
+    """The lines of str(Table)."""
+    yield from table.iter_lines()
+
+
+def _render_delimited(table, delimiter):
+    """
+    Lines of delimiter seperated values, the head first. Empty cells are
+    empty, nested Tables are written as a field in the same format.
+    """
+    fp = io.StringIO()
+    writer = csv.writer(fp, delimiter=delimiter, lineterminator='\n')
+
+    def field(cell):
+        v = cell._value
+        if v is None:
+            return ''
+        elif isinstance(v, Table):
+            return '\n'.join(_render_delimited(v, delimiter))
+        return v
+    rows = table.rows
+    if table._head is not None:
+        rows = chain([table._head], rows)
+    for row in rows:
+        writer.writerow([field(c) for c in row])
+        yield fp.getvalue()[:-1]
+        fp.seek(0)
+        fp.truncate()
+
+
+def _render_csv(table):
+    """Lines of comma seperated values (see _render_delimited)."""
+    return _render_delimited(table, ',')
+
+
+def _render_tsv(table):
+    """Lines of tab seperated values (see _render_delimited)."""
+    return _render_delimited(table, '\t')
+
+
+def _json_value(v):
+    """Nested Tables become an object like the one of _render_json."""
+    if isinstance(v, Table):
+        head = None
+        if v._head is not None:
+            head = [_json_value(c._value) for c in v._head]
+        return {'head': head,
+                'rows': [[_json_value(c._value) for c in row]
+                         for row in v.rows]}
+    return v
+
+
+def _render_json(table):
+    """
+    Lines of a JSON object {"head": [...], "rows": [[...], ...]}, one
+    line for each row. Empty cells are null, other objects are strings.
+    """
+    def dumps(row):
+        return json.dumps([_json_value(c._value) for c in row], default=str)
+    head = 'null' if table._head is None else dumps(table._head)
+    yield f'{{"head": {head}, "rows": ['
+    line = None
+    for row in table.rows:
+        if line is not None:
+            yield line + ','
+        line = '  ' + dumps(row)
+    if line is not None:
+        yield line
+    yield ']}'
+
+
+def _html_value(cell):
+    """The escaped value of a cell, nested Tables as HTML tables."""
+    if isinstance(cell._value, Table):
+        return ''.join(_render_html(cell._value))
+    return html.escape(str(cell.value)).replace('\n', '<br>')
+
+
+def _render_html(table):
+    """Lines of a HTML table, the head in a thead."""
+    yield '<table>'
+    if table._head is not None:
+        yield ('<thead><tr>'
+               + ''.join(f'<th>{_html_value(c)}</th>' for c in table._head)
+               + '</tr></thead>')
+    yield '<tbody>'
+    for row in table.rows:
+        yield ('<tr>'
+               + ''.join(f'<td>{_html_value(c)}</td>' for c in row)
+               + '</tr>')
+    yield '</tbody>'
+    yield '</table>'
+
+
+def _render_markdown(table):
+    """
+    Lines of a Markdown table. The head is empty when the Table has no
+    head. Nested Tables are written as HTML tables.
+    """
+    def line(row):
+        return '| ' + ' | '.join(_html_value(c).replace('|', '\\|')
+                                 for c in row) + ' |'
+    if table.column_count == 0:
+        return
+    if table._head is not None:
+        yield line(table._head)
+    else:
+        yield '|' + '  |' * table.column_count
+    yield '|' + ' --- |' * table.column_count
+    for row in table.rows:
+        yield line(row)
+
+
+_RENDERERS = {
+    'text': _render_text,
+    'csv': _render_csv,
+    'tsv': _render_tsv,
+    'json': _render_json,
+    'html': _render_html,
+    'markdown': _render_markdown,
+}
+
 
 class Table:
     """
@@ -161,6 +1397,16 @@ class Table:
     Nested tables, and cells containing multiple lines, are allowed!
     properties:
         max_width       -- Maxmum width of the Table.
+        width_strategy  -- 'exact' or 'sample': column widths computed from
+                           all rows, or from the first sample_size rows.
+        sample_size     -- Number of rows measured for 'sample'.
+        max_rows        -- Number of rows kept, older rows are evicted.
+        width_workers   -- Number of processes measuring the column widths
+                           of tables with width_threshold cells or more.
+        width_threshold -- Number of cells from which width_workers are used.
+        min_widths      -- List of the minimum width of each column.
+        priorities      -- List of the priority of each column, columns
+                           with a higher priority are trunked last.
         fill            -- String of the default fill for empty cells.
         col_sep         -- String of the column seperator used.
         head_sep        -- String of the head/table seperator used.
@@ -173,19 +1419,40 @@ class Table:
                            table.
         head            -- Iterable object, returning the head from the table.
     methods:
+        from_records    -- Returns a new Table from an iterable of dicts.
+        from_columns    -- Returns a new Table from a dict of columns.
+        from_csv        -- Returns a new Table from a csv file.
         add_head        -- Add a list of column headings to the table.
         add_row         -- Add a list of row data to the table.
+        extend_rows     -- Add the rows of an iterable to the table.
         add_column      -- Add a list of column data to the table.
+        add_columns     -- Add the columns of an iterable to the table.
         remove_head     -- Add a list of column headings to the table.
         remove_row      -- Add a list of row data to the table.
+        remove_rows     -- Removes rows (by slice, or where) in a single pass.
         remove_column   -- Add a list of column data to the table.
+        remove_columns  -- Removes columns (also by slice) in a single pass.
         copy            -- Returns an instance Table containing specified
                            row(s) and/or column(s).
-        log             -- Same as print(Table.copy(row, column)).
+        view            -- Returns a read-only Table showing specified
+                           row(s) and/or column(s), without copying.
+                           Also by indexing: Table[rows, columns].
+        log             -- Same as print(Table.view(row, column)).
+        iter_lines      -- Iterate over the printed lines of the table.
+        render          -- Returns the table as text, csv, json, html, ...
+        pages           -- Iterate over the table rendered in pages of rows.
+        render_to       -- Writes the table to a file object, in chunks.
+        render_diff     -- Returns the lines changed since the last call.
+        aiter_lines     -- Async iterate over the printed lines of the table.
+        arender         -- Async render(), letting other tasks run.
+        arender_to      -- Async render_to() for an asyncio StreamWriter.
     """
 
     def __init__(self, data=None, rows=0, columns=0, max_width=None,
-                 fill=None, head_sep='+=', row_sep='+-', col_sep='|'):
+                 fill=None, head_sep='+=', row_sep='+-', col_sep='|',
+                 storage='rows', width_strategy='exact', sample_size=1000,
+                 width_workers=None, width_threshold=1000000,
+                 max_rows=None, evict='oldest'):
         """
         Keyword arguments:
             data        -- Initial data. Needs to be an iterable object of
@@ -207,8 +1474,62 @@ class Table:
                            When one char is given, crosschar and fillchar are
                            the same.
             col_sep     -- Seperator between columns (default '|').
+            storage     -- How cells are stored: 'rows' (list of rows),
+                           'columnar' (list of columns, faster column
+                           inserts/removals and width caching per column)
+                           or 'ring' (the last max_rows rows, see max_rows)
+                           (default 'rows').
+            width_strategy
+                        -- How column widths are computed: 'exact' (from
+                           all rows) or 'sample' (from the first
+                           sample_size rows, for giant or streamed tables)
+                           (default 'exact').
+            sample_size -- Number of rows measured by width_strategy
+                           'sample' (default 1000).
+            width_workers
+                        -- Number of processes measuring the column widths
+                           of large tables, a block of rows each
+                           (default None: measured in this process).
+            width_threshold
+                        -- Number of cells from which the width_workers
+                           are used (default 1000000).
+            max_rows    -- Keep only the last max_rows rows, in a ring
+                           buffer (storage 'ring'). Adding a row past
+                           max_rows evicts the oldest row (default None).
+            evict       -- Which rows are evicted, only 'oldest' is
+                           supported (default 'oldest').
         """
+        if storage not in _STORAGES:
+            raise ValueError(f'Storage {storage} not supported.')
+        if max_rows is not None:
+            if not isinstance(max_rows, int) or max_rows < 1:
+                raise ValueError('`max_rows` needs to be a positive integer')
+            if storage == 'rows':
+                storage = 'ring'
+            if storage != 'ring':
+                raise ValueError(f'Storage {storage} has no max_rows.')
+            rows = min(rows, max_rows)
+        elif storage == 'ring':
+            raise ValueError("Storage 'ring' needs max_rows.")
+        if evict != 'oldest':
+            raise ValueError(f'Evict {evict} not supported.')
+        self._max_rows = max_rows
+        self._evict = evict
+        self._storage = storage
+        self._width_strategy = 'exact'
+        self._sample_size = 1000
+        self._width_workers = None
+        self._width_threshold = 1000000
         self._head = None
+        self._max_width = None
+        self._fill = '' if fill is None else fill
+        self._data = _STORAGES[storage](self)
+        self._layout = _Layout(self)
+        self._parents = weakref.WeakSet()
+        self._rendered = None
+        self._version = 0
+        self._min_widths = None
+        self._priorities = None
         # TODO More chars for seperators?
         # TODO Row seperator?
         # Set logical args call value
@@ -223,40 +1544,198 @@ class Table:
         elif rows != 0 and columns == 0:
             columns = 1
         if data is None:
-            self._data = [[_Cell(None) for __ in range(columns)]
-                          for __ in range(rows)]
+            for __ in range(rows):
+                self._data.insert_row(len(self._data),
+                                      [self._new_cell()
+                                       for __ in range(columns)])
         else:
-            self._data = []
             for i, row in enumerate(data):
                 if i >= rows and rows != 0:
                     break
-                self._data.append([])
+                cells = []
                 for j, c in enumerate(row):
                     if j >= columns and columns != 0:
                         break
-                    self._data[i].append(_Cell(data[i][j]))
-                while len(self._data[i]) < columns:
-                    self._data[i].append(_Cell(None))
+                    cells.append(self._new_cell(data[i][j]))
+                while len(cells) < columns:
+                    cells.append(self._new_cell())
+                self._data.insert_row(i, cells)
             while len(self._data) < rows:
                 self.add_row()
         self.fill = fill
         self.head_sep = head_sep
         self.row_sep = row_sep
         self.col_sep = col_sep
+        self.width_strategy = width_strategy
+        self.sample_size = sample_size
+        self.width_workers = width_workers
+        self.width_threshold = width_threshold
         self.max_width = max_width
 
+    @classmethod
+    def from_records(cls, records, **kwargs):
+        """
+        Returns a new Table from an iterable of dicts. The keys become the
+        head, in order of appearance. Missing keys are left empty.
+        Keyword arguments:
+        records -- Iterable of dicts, one for each row.
+        kwargs  -- Passed on to Table() (max_width, fill, storage, ...).
+        """
+        records = list(records)
+        for r in records:
+            if not isinstance(r, dict):
+                raise TypeError(f'record={r} not supported.')
+        keys = list(dict.fromkeys(k for r in records for k in r))
+        T = cls(**kwargs)
+        if keys:
+            T.add_head(data=keys)
+        T.extend_rows([r.get(k) for k in keys] for r in records)
+        return T
+
+    @classmethod
+    def from_columns(cls, columns, **kwargs):
+        """
+        Returns a new Table from a dict of columns. The keys become the
+        head. Shorter columns are filled up with empty cells.
+        Keyword arguments:
+        columns -- Dict of lists containing cell data.
+        kwargs  -- Passed on to Table() (max_width, fill, storage, ...).
+        """
+        if not isinstance(columns, dict):
+            raise TypeError(f'columns={columns} not supported.')
+        T = cls(**kwargs)
+        if columns:
+            T.add_head(data=list(columns))
+        T.extend_rows(list(row) for row
+                      in zip_longest(*columns.values(), fillvalue=None))
+        return T
+
+    @classmethod
+    def from_csv(cls, fp, delimiter=',', **kwargs):
+        """
+        Returns a new Table from a csv file. The first row becomes the
+        head. Rows are read one at a time.
+        Keyword arguments:
+        fp          -- File(-like) object, or any iterable of lines.
+        delimiter   -- The field delimiter of the csv (default ',').
+        kwargs      -- Passed on to Table() (max_width, fill, storage, ...).
+        """
+        reader = csv.reader(fp, delimiter=delimiter)
+        T = cls(**kwargs)
+        head = next(reader, None)
+        if head:
+            T.add_head(data=head)
+        T.extend_rows(reader)
+        return T
+
     @property
     def max_width(self):
         return self._max_width
 
-    @max_width.setter
-    def max_width(self, value):
-        """Sets the max_width of the current table."""
-        self._max_width = value
-        W = self.column_widths
-        for row in self._data:
-            for v, c in zip(W, row):
-                c.max_width = v
+    @max_width.setter
+    def max_width(self, value):
+        """Sets the max_width of the current table."""
+        if value == self._max_width:
+            return
+        previous = self._max_width
+        self._max_width = value
+        self._changed(natural=False)
+        try:
+            W = self._layout.widths
+            if self.row_count > 0 and min(W, default=3) < 3:
+                raise ValueError('`max_width` cannot be less then 3')
+        except (TypeError, ValueError):
+            self._max_width = previous
+            self._changed(natural=False)
+            raise
+
+    @property
+    def width_strategy(self):
+        return self._width_strategy
+
+    @width_strategy.setter
+    def width_strategy(self, value):
+        """Sets how column widths are computed ('exact' or 'sample')."""
+        if value not in ('exact', 'sample'):
+            raise ValueError(f'Width strategy {value} not supported.')
+        self._width_strategy = value
+        self._changed()
+
+    @property
+    def sample_size(self):
+        return self._sample_size
+
+    @sample_size.setter
+    def sample_size(self, value):
+        """Sets the number of rows measured by width_strategy 'sample'."""
+        if not isinstance(value, int) or value < 1:
+            raise ValueError('`sample_size` needs to be a positive integer')
+        self._sample_size = value
+        self._changed()
+
+    @property
+    def width_workers(self):
+        return self._width_workers
+
+    @width_workers.setter
+    def width_workers(self, value):
+        """
+        Sets the number of processes measuring the column widths of tables
+        with width_threshold cells or more (None: no processes).
+        """
+        if value is not None and (not isinstance(value, int) or value < 1):
+            raise ValueError('`width_workers` needs to be a positive integer')
+        self._width_workers = value
+
+    @property
+    def width_threshold(self):
+        return self._width_threshold
+
+    @width_threshold.setter
+    def width_threshold(self, value):
+        """Sets the number of cells from which width_workers are used."""
+        if not isinstance(value, int) or value < 0:
+            raise ValueError('`width_threshold` cannot be less then 0')
+        self._width_threshold = value
+
+    @property
+    def min_widths(self):
+        return self._min_widths
+
+    @min_widths.setter
+    def min_widths(self, value):
+        """
+        Sets the minimum width of each column, when trunking to max_width
+        (None: no minimum). Minimums can make the Table wider than
+        max_width.
+        """
+        self._set_column_option('_min_widths', value)
+
+    @property
+    def priorities(self):
+        return self._priorities
+
+    @priorities.setter
+    def priorities(self, value):
+        """
+        Sets the priority of each column, when trunking to max_width.
+        Columns with a higher priority are trunked last (None: 0).
+        """
+        self._set_column_option('_priorities', value)
+
+    def _set_column_option(self, name, value):
+        if value is not None:
+            if not isinstance(value, (list, tuple)) or not all(
+                    v is None or isinstance(v, int) for v in value):
+                raise TypeError(f'{value} needs to be a list of integers.')
+            value = list(value)
+        previous = getattr(self, name)
+        setattr(self, name, value)
+        self._changed(natural=False)
+        if self.row_count > 0 and min(self._layout.widths, default=3) < 3:
+            setattr(self, name, previous)
+            self._changed(natural=False)
+            raise ValueError('Column widths cannot be less then 3')
 
     @property
     def head_sep(self):
@@ -300,6 +1779,7 @@ class Table:
         if not isinstance(value, str) or len(value) > 1:
             raise ValueError('Column sep needs to be a string of one char.')
         self._col_sep = value + ' '
+        self._changed(natural=False)
 
     @property
     def fill(self):
@@ -308,12 +1788,13 @@ class Table:
     @fill.setter
     def fill(self, value):
         """Sets the default filling to use. Can be of any type."""
-        # TODO - Resetting fill should work on all `empty` cells
+        # Cells read the fill from their table, when empty
         if value is None:
             value = ''
+        if value == self._fill:
+            return
         self._fill = value
-        for cell in self.cells:
-            cell.fill = value
+        self._changed()
 
     @property
     def row_count(self):
@@ -329,53 +1810,39 @@ class Table:
         elif self.row_count == 0:
             return len(self._head)
         else:
-            return len(self._data[0])
+            return self._data.width
 
     @property
     def column_widths(self):
         """Return a list of column widths."""
-        M = []
-        # Add head when calculating max-widths?
-        if self._head is not None:
-            z = zip(self.head, *self.rows)
-        else:
-            z = self.columns
-        for column in z:
-            # One space extra...
-            mx = max(len(c) + len(self.col_sep) - 1 for c in column)
-            if mx < 3:
-                M.append(3)
-            else:
-                M.append(mx)
-        # The last column needs to be smaller
-        # Only if col_sep is set
-        if len(M) > 0 and M[len(M)-1] > 3:
-            M[len(M)-1] -= len(self.col_sep) - 1
-        if self.max_width is not None:
-            # Trunk the width of each column
-            # Starting with the largest column
-            # Remove the seperators for the Cell's max-width
-            col_max = self.max_width - len(self.col_sep) * (len(M) - 1)
-            while sum(M) > col_max:
-                i = M.index(max(M))
-                M[i] -= 1
-        return M
+        return list(self._layout.widths)
+
+    @property
+    def storage(self):
+        """Returns the storage of the cells ('rows', 'columnar' or 'ring')."""
+        return self._storage
+
+    @property
+    def max_rows(self):
+        """Returns the number of rows kept (None: all rows)."""
+        return self._max_rows
+
+    @property
+    def evict(self):
+        """Returns which rows are evicted past max_rows ('oldest')."""
+        return self._evict
 
     @property
     def cells(self):
-        for row in self._data:
-            for cell in row:
-                yield cell
+        yield from self._data.cells()
 
     @property
     def rows(self):
-        for row in self._data:
-            yield row
+        yield from self._data
 
     @property
     def columns(self):
-        for column in zip(*self._data):
-            yield column
+        yield from self._data.columns()
 
     @property
     def head(self):
@@ -387,55 +1854,120 @@ class Table:
         return (f'<Table object: {self.row_count} rows'
                 f' and {self.column_count} columns>')
 
+    def __getstate__(self):
+        """Tables are pickled without their owners (see __setstate__)."""
+        state = self.__dict__.copy()
+        del state['_parents']
+        return state
+
+    def __setstate__(self, state):
+        """The owners are added again by their cells, when unpickled."""
+        self.__dict__.update(state)
+        self._parents = weakref.WeakSet()
+
     def __str__(self):
         """
         A performance heavy operation. Returns a string representation,
         of the current table. Trunks values as needed (set by max_width).
         Also adds seperators specified by head_sep, row_sep and col_sep.
         """
-        string = ''
-        if self._head is not None:
-            string += self._convert_row_to_string(self._head, self.col_sep)
-            if self.head_sep is not None:
-                sep_row = [_Cell(self.head_sep[1:] * j)
-                           for j in self.column_widths]
-                string += self._convert_row_to_string(sep_row, self.head_sep)
-        rows = []
-        for row in self.rows:
-            rows.append(self._convert_row_to_string(row, self.col_sep))
-        if self.row_sep is not None:
-            sep_row = [_Cell(self.row_sep[1:] * j)
-                       for j in self.column_widths]
-            sep = self._convert_row_to_string(sep_row, self.row_sep)
-            string += sep.join(rows)
-        else:
-            string += ''.join(rows)
-        return string.strip('\n')
+        if _stats is not None:
+            return '\n'.join(_stats.output(self.iter_lines()))
+        return '\n'.join(self.iter_lines())
 
     def __len__(self):
         """Returns the total width of the table when printed"""
         if self.column_count == 0:
             return 0
         else:
-            return (sum(self.column_widths)
+            return (sum(self._layout.widths)
                     + len(self.col_sep)
                     * (self.column_count - 1))
 
+    def __getitem__(self, key):
+        """
+        Returns the value of the cell at table[row, column], or a view
+        (see view()) of the selected rows and columns. Rows and columns
+        are selected by an integer, slice, list of integers or list of
+        booleans (a mask), columns also by (a list of) head names.
+        Example: table[10:500, ['name', 2]]
+        """
+        if isinstance(key, tuple):
+            if len(key) != 2:
+                raise IndexError('Table indices are [rows, columns]')
+            rows, columns = key
+        else:
+            rows, columns = key, slice(None)
+        rows = self._indices(rows, self.row_count, 'row')
+        columns = self._indices(columns, self.column_count, 'column')
+        if isinstance(rows, int) and isinstance(columns, int):
+            return self._data.cell(rows, columns).value
+        if isinstance(rows, int):
+            rows = [rows]
+        if isinstance(columns, int):
+            columns = [columns]
+        return _TableView(self, rows, columns)
+
+    def _indices(self, key, count, name):
+        """
+        Returns the index, or the list of indices, selected by key (see
+        __getitem__). Returns None when all are selected.
+        """
+        if isinstance(key, slice):
+            if key == slice(None):
+                return None
+            return range(*key.indices(count))
+        if isinstance(key, (int, str)):
+            return self._index(key, count, name)
+        keys = list(key)
+        if keys and all(isinstance(k, bool) for k in keys):
+            if len(keys) != count:
+                raise IndexError(f'Mask of {len(keys)} for {count} {name}s')
+            return [i for i, k in enumerate(keys) if k]
+        return [self._index(k, count, name) for k in keys]
+
+    def _index(self, key, count, name):
+        if isinstance(key, str) and name == 'column':
+            head = [] if self._head is None else [h._value for h in self._head]
+            if key not in head:
+                raise KeyError(f'No column {key} in head')
+            return head.index(key)
+        if not isinstance(key, int):
+            raise TypeError(f'{name} index {key} not supported.')
+        if not -count <= key < count:
+            raise IndexError(f'{name.capitalize()} index {key} out of range')
+        return key % count
+
+    def _new_cell(self, value=None):
+        """Returns a new Cell belonging to this table."""
+        return _Cell(value, owner=self)
+
+    def _changed(self, natural=True, rows=None):
+        """
+        Drops the cached layout of this table, and of the tables containing
+        this table. Called on every change of data, fill, max_width or
+        col_sep. When only rows were added, their widths are merged into
+        the cached layout instead.
+        """
+        self._version += 1
+        if rows is not None:
+            self._layout.add_rows(rows)
+        else:
+            self._layout.invalidate(natural)
+        for table in self._parents:
+            table._changed()
+
     def _keep_table_dimensions(fn):
         """(Decorator) Make sure the rows and columns stay equal in size"""
         @wraps(fn)
         def wrap_fn(self, *args, **kwargs):
             fn(self, *args, **kwargs)
-            if self._head is None:
-                m = max(len(r) for r in self.rows)
-                for row in self.rows:
-                    while len(row) < m:
-                        row.append(_Cell(None))
-            else:
-                m = max(len(r) for r in [self._head, *self.rows])
-                for row in [self._head, *self.rows]:
-                    while len(row) < m:
-                        row.append(_Cell(None))
+            m = self._data.width
+            if self._head is not None:
+                m = max(m, len(self._head))
+                while len(self._head) < m:
+                    self._head.append(self._new_cell())
+            self._data.resize(m)
         return wrap_fn
 
     def _args_to_kwargs(*fargs):
@@ -494,8 +2026,9 @@ class Table:
         if index is None:
             index = len(self._head)
         self._head = [*self._head[:index],
-                      *[_Cell(d) for d in data],
+                      *[self._new_cell(d) for d in data],
                       *self._head[index+len(data):]]
+        self._changed()
 
     @_args_to_kwargs('data', 'index')
     @_verify_data
@@ -509,13 +2042,51 @@ class Table:
         index   -- The position of the newly added row starting at 0.
                    (default None: last row)
         """
-        if index is None:
-            index = self.row_count
-        if len(data) == 0 and self.row_count == 0:
+        n = self.row_count
+        if index is None or index > n:
+            index = n
+        elif index < 0:
+            index = max(0, n + index)
+        if len(data) == 0 and n == 0:
             data = [None]
-        self._data = [*self._data[:index],
-                      [_Cell(d) for d in data],
-                      *self._data[index:]]
+        self._data.insert_row(index, [self._new_cell(d) for d in data])
+        if self.max_rows is not None:
+            # Rows may be evicted, the store keeps the widths
+            self._changed()
+        elif self.width_strategy == 'sample' and index < self.sample_size:
+            # The sampled rows changed
+            self._changed()
+        else:
+            self._changed(rows=[self._data[index]])
+
+    @_keep_table_dimensions
+    def extend_rows(self, rows):
+        """
+        Add the rows of an iterable (list, generator, DB cursor, ...) to
+        the end of the table, in a single pass. Rows are padded to an
+        equal length once, after all rows are added.
+        Custom decorator: @_keep_table_dimensions (see docstring)
+        Keyword arguments:
+        rows    -- Iterable of lists containing cell data.
+        """
+        new = self._new_cell
+        start = self.row_count
+
+        def cells():
+            for row in rows:
+                if not isinstance(row, (list, tuple, set, str)):
+                    raise TypeError(f'data={row} not supported.')
+                yield [new(d) for d in row] or [new()]
+        self._data.extend_rows(cells())
+        if self.max_rows is not None:
+            # Rows may be evicted, the store keeps the widths
+            self._changed()
+        elif self.width_strategy == 'sample' and start < self.sample_size:
+            # The sampled rows changed
+            self._changed()
+        else:
+            self._changed(rows=(self._data[i]
+                                for i in range(start, self.row_count)))
 
     @_args_to_kwargs('data', 'head', 'index')
     @_verify_data
@@ -533,27 +2104,55 @@ class Table:
         if index is None:
             index = self.column_count
         if self.row_count == 0 and len(data) == 0:
-            self._data.append([])
-        while len(data) > self.row_count:
-            self._data.append([])
-        for i in range(self.row_count):
-            if i < len(data):
-                value = data[i]
-            else:
-                value = None
-            self._data[i] = [*self._data[i][:index],
-                             _Cell(value),
-                             *self._data[i][index:]]
+            data = [None]
+        self._data.insert_column(index, [self._new_cell(d) for d in data])
+        self._changed()
         if self._head is not None:
-            if head is None:
-                head = None
-            self._head = [*self._head[:index],
-                          _Cell(head),
-                          *self._head[index:]]
+            self._head.insert(index, self._new_cell(head))
         elif head is not None:
             self.add_head()
             self._head[index].value = head
 
+    @_keep_table_dimensions
+    def add_columns(self, columns, heads=None, index=None):
+        """
+        Add the columns of an iterable to the table, in a single pass over
+        the rows. Rows are padded to an equal length once.
+        Custom decorator: @_keep_table_dimensions (see docstring)
+        Keyword arguments:
+        columns -- Iterable of lists containing cell data.
+        heads   -- List of the table heading of each column (default None).
+        index   -- The position of the first new column starting at 0
+                   (default None: after the last column).
+        """
+        new = self._new_cell
+        data = []
+        for column in columns:
+            if column is None:
+                column = []
+            if not isinstance(column, (list, tuple, set, str)):
+                raise TypeError(f'data={column} not supported.')
+            data.append(column)
+        if heads is not None and len(heads) != len(data):
+            raise ValueError(f'heads={heads} needs one head per column.')
+        if not data:
+            return
+        if index is None:
+            index = self.column_count
+        if self.row_count == 0 and all(len(d) == 0 for d in data):
+            data = [[None]] * len(data)
+        self._data.insert_columns(index, [[new(d) for d in column]
+                                          for column in data])
+        self._changed()
+        if heads is None:
+            heads = [None] * len(data)
+        if self._head is not None:
+            self._head[index:index] = [new(h) for h in heads]
+        elif any(h is not None for h in heads):
+            self.add_head()
+            for j, h in enumerate(heads):
+                self._head[index + j].value = h
+
     def _remove_data(fn):
         """
         Decorator for remove_*() functions. Checks if keyword arguments are
@@ -588,6 +2187,7 @@ class Table:
                     index = set(index)
                 kwargs['index'] = index
             fn(self, **kwargs)
+            self._changed()
         return wrap_remove
 
     @_remove_data
@@ -607,7 +2207,7 @@ class Table:
                 self._head = None
             else:
                 for i in index:
-                    self._head[i] = _Cell(None)
+                    self._head[i] = self._new_cell()
 
     @_remove_data
     def remove_row(self, index=None, removehead=True):
@@ -624,8 +2224,7 @@ class Table:
         # Table should always contain equal length rows and head!
         if index is None:
             index = [self.row_count - 1]
-        for r, i in enumerate(index):
-            self._data = self._data[:i-r] + self._data[i-r+1:]
+        self._data.remove_rows(index)
         if removehead and self.row_count == 0:
             self.remove_head()
 
@@ -645,14 +2244,61 @@ class Table:
         if index is None:
             index = [self.column_count - 1]
         if removehead:
-            for r, i in enumerate(index):
-                self._data = [row[:i-r] + row[i-r+1:] for row in self.rows]
-                if self._head is not None:
-                    self._head = self._head[:i-r] + self._head[i-r+1:]
+            self._data.remove_columns(index)
+            if self._head is not None:
+                remove = set(index)
+                self._head = [h for j, h in enumerate(self._head)
+                              if j not in remove]
         else:
             for i in index:
-                for row in self.rows:
-                    row[i] = _Cell(None)
+                self._data.clear_column(i)
+
+    def remove_rows(self, index=None, where=None, removehead=True):
+        """
+        Removes rows of the table at once, in a single pass over the rows.
+        Give either index or where.
+        Keyword arguments:
+        index      -- Integer, slice or iterable of row(s) to be removed
+                      (default None).
+        where      -- Function of the list of values of a row, returning
+                      True for the rows to be removed (default None).
+        removehead -- Boolean: remove head when there are no rows left,
+                      leaving an empty table (default True).
+        Note: index start at 0!
+        """
+        if (index is None) == (where is None):
+            raise ValueError('remove_rows needs either index or where.')
+        if where is not None:
+            index = [i for i, row in enumerate(self._data)
+                     if where([c.value for c in row])]
+        elif isinstance(index, slice):
+            index = range(*index.indices(self.row_count))
+        elif isinstance(index, int):
+            index = [index]
+        if not isinstance(index, range):
+            index = list(index)
+        if not index:
+            return
+        self.remove_row(index=index, removehead=removehead)
+
+    def remove_columns(self, index, removehead=True):
+        """
+        Removes columns of the table, in a single pass over the rows.
+        Same as remove_column, also for a slice.
+        Keyword arguments:
+        index      -- Integer, slice or iterable of column(s) to be removed.
+        removehead -- Boolean: if true, head is also removed (default
+                      True).
+        Note: index start at 0!
+        """
+        if isinstance(index, slice):
+            index = range(*index.indices(self.column_count))
+        elif isinstance(index, int):
+            index = [index]
+        index = list(index)
+        if not index:
+            return
+        self.remove_column(index=index, removehead=removehead)
 
     def copy(self, rows=None, columns=None):
         """
@@ -667,58 +2313,97 @@ class Table:
                    (default None).
         Note: index start at 0!
         """
-        if isinstance(rows, dict):
-            raise TypeError('Dicts are not supported for copying rows')
-        if isinstance(columns, dict):
-            raise TypeError('Dicts are not supported for copying columns')
-        # Make sure rows and columns list contain no duplicates
-        if isinstance(rows, list):
-            rows = set(rows)
-        if isinstance(columns, list):
-            columns = set(columns)
-        if isinstance(rows, int):
-            rows = [rows]
-        if isinstance(columns, int):
-            columns = [columns]
-        if rows is not None and max(rows) >= self.row_count:
-            raise IndexError('Exceeding max rows.\n' + repr(self))
-        if columns is not None and max(columns) >= self.column_count:
-            raise IndexError('Exceeding max columns.\n' + repr(self))
+        rows, columns = self._selection(rows, columns)
         T = Table(
                 max_width=self.max_width,
                 fill=self.fill,
                 head_sep=self.head_sep,
                 row_sep=self.row_sep,
-                col_sep=self.col_sep[:1]
+                col_sep=self.col_sep[:-1],
+                storage=self.storage,
+                width_strategy=self.width_strategy,
+                sample_size=self.sample_size,
+                width_workers=self.width_workers,
+                width_threshold=self.width_threshold,
+                max_rows=self.max_rows,
+                evict=self.evict
         )
         if rows is None and columns is None:
-            T._data = [[c.copy() for c in row] for row in self.rows]
+            T._data = _STORAGES[self.storage](
+                T, ([c.copy(owner=T) for c in row] for row in self.rows)
+            )
             if self._head is not None:
-                T._head = [h.copy() for h in self.head]
+                T._head = [h.copy(owner=T) for h in self.head]
+            T._min_widths = copy.copy(self.min_widths)
+            T._priorities = copy.copy(self.priorities)
+            T._changed()
         elif rows is None:
             for c in columns:
-                col = [r[c].copy() for r in self.rows]
+                col = [r[c].copy().value for r in self.rows]
                 head = None
                 if self._head is not None:
-                    head = self._head[c].copy()
+                    head = self._head[c].copy().value
                 T.add_column(head=head, data=col)
         elif columns is None:
             for r in rows:
-                T.add_row(data=[c.copy() for c in self._data[r]])
+                T.add_row(data=[c.copy().value for c in self._data[r]])
             if self._head is not None:
-                T.add_head(data=[c.copy() for c in self.head])
+                T.add_head(data=[c.copy().value for c in self.head])
         else:
-            T._data = []
-            for r in rows:
-                T._data.append([self._data[r][c].copy() for c in columns])
+            T._data = _STORAGES[self.storage](
+                T, ([self._data[r][c].copy(owner=T) for c in columns]
+                    for r in rows)
+            )
+            T._changed()
             if self._head is not None:
-                T.add_head(data=[self._head[c].copy() for c in columns])
+                T.add_head(data=[self._head[c].copy().value
+                                 for c in columns])
         return T
 
+    def _selection(self, rows, columns):
+        """Checks the rows and columns given to copy() or view()."""
+        if isinstance(rows, dict):
+            raise TypeError('Dicts are not supported for copying rows')
+        if isinstance(columns, dict):
+            raise TypeError('Dicts are not supported for copying columns')
+        # Make sure rows and columns list contain no duplicates
+        if isinstance(rows, list):
+            rows = set(rows)
+        if isinstance(columns, list):
+            columns = set(columns)
+        if isinstance(rows, int):
+            rows = [rows]
+        if isinstance(columns, int):
+            columns = [columns]
+        if rows is not None and max(rows) >= self.row_count:
+            raise IndexError('Exceeding max rows.\n' + repr(self))
+        if columns is not None and max(columns) >= self.column_count:
+            raise IndexError('Exceeding max columns.\n' + repr(self))
+        return rows, columns
+
+    def view(self, rows=None, columns=None):
+        """
+        Returns a read-only Table showing row(s) and/or column(s) of the
+        current Table, without copying the cells. Changes of the current
+        Table show in the view. Use materialize() on the view for a copy.
+        Keyword arguments:
+        rows     -- Integer, range or list of the corresponding row(s)
+                   (default None: all rows).
+        columns  -- Integer, range or list of the corresponding column(s)
+                   (default None: all columns).
+        Note: index start at 0!
+        """
+        rows, columns = self._selection(rows, columns)
+        if isinstance(rows, set):
+            rows = sorted(rows)
+        if isinstance(columns, set):
+            columns = sorted(columns)
+        return _TableView(self, rows, columns)
+
     def log(self, row=None, column=None):
         """
         Prints the Cell, row or column.
-        Same as print(Table.copy(row, column)).
+        Same as print(Table.view(row, column)).
         Keyword arguments:
         row     -- Integer or range of the corresponding row(s)
                    (default None).
@@ -726,31 +2411,574 @@ class Table:
                    (default None).
         Note: index start at 0!
         """
-        # TODO Make logging more efficient...
-        print(self.copy(row=row, column=column))
+        print(self.view(rows=row, columns=column))
+
+    def iter_lines(self):
+        """
+        Iterate over the lines of the string representation of the table.
+        Rows are rendered one at a time, while iterating. Joining the lines
+        with newlines gives the same string as str(Table).
+        """
+        yield from self._iter_lines(self._data)
+
+    def _iter_lines(self, rows, block_size=_BLOCK):
+        """
+        The lines of iter_lines(), for the given rows of the table, read
+        block_size rows at a time.
+        """
+        if self._head is not None:
+            yield from self._convert_row_to_lines(self._head, self.col_sep)
+            if self.head_sep is not None:
+                sep_row = [_Cell(self.head_sep[1:] * j)
+                           for j in self._layout.widths]
+                yield from self._convert_row_to_lines(sep_row, self.head_sep)
+        sep = None
+        rows = iter(rows)
+        # Numbers are trunked a block of rows at a time
+        block = list(islice(rows, block_size))
+        first = True
+        while block:
+            self._format_columns(block)
+            for row in block:
+                if not first and self.row_sep is not None:
+                    if sep is None:
+                        sep_row = [_Cell(self.row_sep[1:] * j)
+                                   for j in self._layout.widths]
+                        sep = self._convert_row_to_lines(sep_row,
+                                                         self.row_sep)
+                    yield from sep
+                first = False
+                yield from self._convert_row_to_lines(row, self.col_sep)
+            block = list(islice(rows, block_size))
+
+    @staticmethod
+    def add_format(name, renderer):
+        """
+        Adds an output format for render() and render_to().
+        Keyword arguments:
+        name        -- Name of the format.
+        renderer    -- Function of a Table, returning an iterable of the
+                       lines of the output.
+        """
+        if not callable(renderer):
+            raise TypeError(f'Renderer {renderer} is not callable.')
+        _RENDERERS[name] = renderer
+
+    def _render_lines(self, format, start=None, stop=None, widths='table',
+                      workers=None):
+        lines = self._select_lines(format, start, stop, widths, workers)
+        if _stats is not None:
+            return _stats.output(lines)
+        return lines
+
+    def _select_lines(self, format, start, stop, widths, workers):
+        """The lines of the format, for the rows from start to stop."""
+        if format not in _RENDERERS:
+            raise ValueError(f'Format {format} not supported.')
+        if widths not in ('table', 'window'):
+            raise ValueError(f'Widths {widths} not supported.')
+        if workers is not None and format == 'text':
+            if start is None and stop is None:
+                return self._parallel_lines(self.rows, workers)
+            window = self[start:stop]
+            if widths == 'window':
+                return window._parallel_lines(window.rows, workers)
+            return self._parallel_lines(window.rows, workers)
+        if start is None and stop is None:
+            return _RENDERERS[format](self)
+        window = self[start:stop]
+        if format == 'text' and widths == 'table':
+            return self._iter_lines(list(window._data))
+        return _RENDERERS[format](window)
+
+    def _parallel_lines(self, rows, workers):
+        """
+        The lines of _iter_lines(rows). The column widths are computed
+        first, then blocks of rows are rendered by a pool of workers: a
+        process pool, or a thread pool when Python runs without the GIL.
+        The values of the cells are pickled to the worker processes.
+        """
+        widths = self._layout.widths
+        settings = {'fill': self._fill, 'head_sep': self.head_sep or '',
+                    'row_sep': self.row_sep or '',
+                    'col_sep': self.col_sep[:-1]}
+        render = partial(_render_rows, settings, widths)
+        sep = None
+        if self.row_sep is not None:
+            sep_row = [_Cell(self.row_sep[1:] * j) for j in widths]
+            sep = self._convert_row_to_lines(sep_row, self.row_sep)
+        pool = _pool(workers)
+        # The head only
+        yield from self._iter_lines(())
+        with pool:
+            for i, lines in enumerate(pool.map(render, _blocks(rows))):
+                if i > 0 and sep is not None:
+                    yield from sep
+                yield from lines
+
+    def render(self, format='text', start=None, stop=None, widths='table',
+               workers=None):
+        """
+        Returns the table as a string in the given format. Other formats
+        than 'text' are not trunked, and don't compute column widths.
+        Keyword arguments:
+        format  -- 'text', 'csv', 'tsv', 'json', 'html', 'markdown' or a
+                   format added by add_format (default 'text').
+        start   -- First row to render (default None: first row).
+        stop    -- Row to stop before (default None: after the last row).
+        widths  -- 'table': column widths of the whole table, so windows
+                   line up. 'window': column widths of the rendered rows
+                   only, without reading the other rows (default 'table').
+        workers -- Number of processes rendering blocks of rows at once,
+                   for large tables in the 'text' format. The values of
+                   the cells need to be picklable (default None: render
+                   in this process).
+        """
+        return '\n'.join(self._render_lines(format, start, stop, widths,
+                                            workers))
+
+    def pages(self, page_height, format='text', widths='table'):
+        """
+        Iterate over the pages of the table, rendered one at a time (see
+        render). Each page has the head, and page_height rows.
+        Keyword arguments:
+        page_height -- Number of rows on each page.
+        format      -- Output format, see render() (default 'text').
+        widths      -- 'table' or 'window', see render() (default 'table').
+        """
+        if page_height < 1:
+            raise ValueError('`page_height` cannot be less then 1')
+        for start in range(0, self.row_count, page_height):
+            yield self.render(format, start, start + page_height, widths)
+
+    def render_to(self, fp, chunk_size=64, format='text'):
+        """
+        Writes the table to the file object fp, one chunk of lines at a
+        time. Each line is ended by a newline, same as print(Table).
+        Keyword arguments:
+        fp          -- File(-like) object with a write method.
+        chunk_size  -- Number of lines per write (default 64).
+        format      -- Output format, see render() (default 'text').
+        """
+        if chunk_size < 1:
+            raise ValueError('`chunk_size` cannot be less then 1')
+        chunk = []
+        for line in self._render_lines(format):
+            chunk.append(line)
+            if len(chunk) >= chunk_size:
+                chunk.append('')
+                fp.write('\n'.join(chunk))
+                chunk = []
+        if chunk:
+            chunk.append('')
+            fp.write('\n'.join(chunk))
+
+    async def _alines(self, format='text', chunk_size=64, offload=False,
+                      executor=None):
+        """
+        The lines of _render_lines(format), giving control back to the
+        event loop after every chunk_size lines.
+        """
+        if chunk_size < 1:
+            raise ValueError('`chunk_size` cannot be less then 1')
+        if offload and format == 'text':
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(executor, lambda: self._layout.widths)
+        for i, line in enumerate(self._render_lines(format), 1):
+            yield line
+            if i % chunk_size == 0:
+                await asyncio.sleep(0)
+
+    async def aiter_lines(self, chunk_size=64, offload=False, executor=None):
+        """
+        Async iterate over the lines of the string representation of the
+        table (see iter_lines). Other tasks run after every chunk of lines.
+        The table shouldn't be changed by other tasks while iterating.
+        Keyword arguments:
+        chunk_size  -- Number of lines between giving control back to the
+                       event loop (default 64).
+        offload     -- Compute the column widths in the executor first,
+                       outside the event loop (default False).
+        executor    -- Executor for offload, None for the default executor
+                       of the loop (default None).
+        """
+        async for line in self._alines('text', chunk_size, offload,
+                                       executor):
+            yield line
+
+    async def arender(self, format='text', chunk_size=64, offload=False,
+                      executor=None):
+        """
+        Returns the table as a string in the given format, same as render.
+        Other tasks run after every chunk of lines.
+        Keyword arguments:
+        format      -- Output format, see render() (default 'text').
+        chunk_size  -- Number of lines between giving control back to the
+                       event loop (default 64).
+        offload     -- See aiter_lines() (default False).
+        executor    -- See aiter_lines() (default None).
+        """
+        return '\n'.join([line async for line in self._alines(
+            format, chunk_size, offload, executor)])
+
+    async def arender_to(self, writer, chunk_size=64, format='text',
+                         encoding='utf-8', offload=False, executor=None):
+        """
+        Writes the table to an asyncio StreamWriter, one chunk of lines at
+        a time, same as render_to. Waits for the writer to drain after
+        each chunk.
+        Keyword arguments:
+        writer      -- asyncio.StreamWriter, or an object with a write
+                       method of bytes and a drain coroutine.
+        chunk_size  -- Number of lines per write (default 64).
+        format      -- Output format, see render() (default 'text').
+        encoding    -- Encoding of the written bytes (default 'utf-8').
+        offload     -- See aiter_lines() (default False).
+        executor    -- See aiter_lines() (default None).
+        """
+        chunk = []
+        async for line in self._alines(format, chunk_size, offload,
+                                       executor):
+            chunk.append(line)
+            if len(chunk) >= chunk_size:
+                chunk.append('')
+                writer.write('\n'.join(chunk).encode(encoding))
+                await writer.drain()
+                chunk = []
+        if chunk:
+            chunk.append('')
+            writer.write('\n'.join(chunk).encode(encoding))
+            await writer.drain()
+
+    def render_diff(self, full=False):
+        """
+        Returns the lines which changed since the previous call, as a list
+        of (offset, line) tuples, for repainting a live table. Only rows
+        with a changed cell are rendered again, unless the column widths,
+        fill or seperators changed. Lines past the end of the table are
+        returned as (offset, None).
+        Keyword arguments:
+        full    -- Return all lines, e.g. after clearing the screen
+                   (default False).
+        """
+        self._format_columns()
+        key = (tuple(self._layout.widths), self.fill,
+               self.col_sep, self.row_sep, self.head_sep)
+        old_key, old_rows, old_lines = self._rendered or (None, [], [])
+        if key != old_key:
+            old_rows = []
+        lines = []
+        if self._head is not None:
+            lines.extend(self._convert_row_to_lines(self._head, self.col_sep))
+            if self.head_sep is not None:
+                sep_row = [_Cell(self.head_sep[1:] * j)
+                           for j in self._layout.widths]
+                lines.extend(self._convert_row_to_lines(sep_row,
+                                                        self.head_sep))
+        rows = []
+        sep = None
+        for i, row in enumerate(self._data):
+            if i > 0 and self.row_sep is not None:
+                if sep is None:
+                    sep_row = [_Cell(self.row_sep[1:] * j)
+                               for j in self._layout.widths]
+                    sep = self._convert_row_to_lines(sep_row, self.row_sep)
+                lines.extend(sep)
+            # Containers can change in place, nested Tables count changes
+            state = [(c, c._value, c._key(None)) for c in row]
+            if i < len(old_rows) and len(old_rows[i][0]) == len(state) \
+                    and all(c is o and v is w and k == m and c._cached()
+                            for (c, v, k), (o, w, m)
+                            in zip(state, old_rows[i][0])):
+                row_lines = old_rows[i][1]
+            else:
+                row_lines = self._convert_row_to_lines(row, self.col_sep)
+            rows.append((state, row_lines))
+            lines.extend(row_lines)
+        self._rendered = (key, rows, lines)
+        changes = [(i, line) for i, line in enumerate(lines)
+                   if full or i >= len(old_lines) or line != old_lines[i]]
+        changes.extend((i, None) for i in range(len(lines), len(old_lines)))
+        return changes
+
+    def _format_columns(self, rows=None):
+        """
+        Trunks the numbers of each column at once (see _format_numbers),
+        before the rows (default None: all rows) are rendered one at a
+        time. Only with NumPy.
+        """
+        if np is None:
+            return
+        if rows is None or rows is self._data:
+            columns = self._data.columns()
+        else:
+            columns = zip(*rows)
+        for column, w in zip(columns, self._layout.widths):
+            cells = [c for c in column if type(c._value) in (int, float)
+                     and (c._lines is None or c._lines[0] != c._key(w))]
+            if len(cells) > 1:
+                values = _format_numbers([c._value for c in cells], w)
+                for c, v in zip(cells, values):
+                    c._set_number(w, v)
 
-    def _convert_row_to_string(self, row, sep):
-        string = ''
-        for i, c in enumerate(row):
-            c.fill = self.fill
-            c.max_width = self.column_widths[i]
-        for line in zip_longest(*row, fillvalue=''):
+    def _convert_row_to_lines(self, row, sep):
+        W = self._layout.widths
+        cells = [c.lines(w) for c, w in zip(row, W)]
+        lines = []
+        for line in zip_longest(*cells, fillvalue=''):
+            string = []
             for i, value in enumerate(line):
                 if value is None:
                     value = self.fill
-                string += value.ljust(self.column_widths[i])
-                if i < len(self.column_widths) - 1:
-                    string += sep
-                else:
-                    string += '\n'
-        return string
+                # Nested tables can change the layout while trunking
+                W = self._layout.widths
+                string.append(value.ljust(W[i]))
+            lines.append(sep.join(string))
+        return lines
+
+
+class _ViewParents(weakref.WeakSet):
+    """
+    The Tables a view is nested in. A nested view follows the changes of
+    the viewed Table, to notify them (see _TableView._sync).
+    """
+
+    def __init__(self, view):
+        super().__init__()
+        self._view = weakref.ref(view)
+
+    def add(self, table):
+        super().add(table)
+        view = self._view()
+        view._table._parents.add(view)
+
+
+def _synced(name):
+    """
+    (Property) An attribute of a view, brought up to date with the viewed
+    Table when read.
+    """
+    def get(self):
+        self._sync()
+        return self.__dict__[name]
+
+    def set(self, value):
+        self.__dict__[name] = value
+    return property(get, set)
+
+
+class _TableView(Table):
+    """
+    A read-only Table showing rows and columns of another Table (see
+    Table.view). The cells, fill and head are those of the other Table.
+    Views don't follow the changes of the viewed Table, they compare its
+    _version when read: short lived views (T[i], pages, ...) cost nothing
+    to the viewed Table.
+    """
+
+    _head = _synced('_head')
+    _fill = _synced('_fill')
+    _layout = _synced('_layout')
+    _version = _synced('_version')
+
+    def __init__(self, table, rows, columns):
+        self._table = table
+        self._columns = columns
+        super().__init__(max_width=table.max_width, fill=table.fill,
+                         head_sep=table.head_sep or '',
+                         row_sep=table.row_sep or '',
+                         col_sep=table.col_sep[:-1], storage=table.storage,
+                         width_strategy=table.width_strategy,
+                         sample_size=table.sample_size,
+                         width_workers=table.width_workers,
+                         width_threshold=table.width_threshold,
+                         max_rows=table.max_rows, evict=table.evict)
+        self._data = _ViewStore(table._data, rows, columns)
+        self._parents = _ViewParents(self)
+        self._seen = None
+        self._sync()
+
+    def __repr__(self):
+        """Representation of this object. Nr of columns and rows are added."""
+        return (f'<Table view: {self.row_count} rows'
+                f' and {self.column_count} columns>')
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._parents = _ViewParents(self)
+
+    def _sync(self):
+        """Follows the viewed Table, when it changed since last read."""
+        state = self.__dict__
+        if '_seen' in state and state['_seen'] != self._table._version:
+            self._changed()
+
+    def _changed(self, natural=True, rows=None):
+        """Follows the head and fill of the viewed Table."""
+        T = self._table
+        self.__dict__['_seen'] = T._version
+        self._fill = T.fill
+        if T._head is None:
+            self._head = None
+        elif self._columns is None:
+            self._head = list(T._head)
+        else:
+            self._head = [T._head[j] for j in self._columns]
+        super()._changed(natural)
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError('A Table view is read-only, see materialize()')
+
+    add_head = add_row = extend_rows = add_column = _read_only
+    add_columns = remove_rows = remove_columns = _read_only
+    remove_head = remove_row = remove_column = _read_only
+
+    def materialize(self):
+        """Returns a Table with copies of the cells of this view."""
+        return self.copy()
+
+
+class StreamingTable(Table):
+    """
+    A Table rendered while its rows are read from an iterable (generator,
+    DB cursor, log, ...). The column widths are fixed when created: given
+    by widths, or measured on the first sample rows. Only those sample
+    rows are kept, later rows are rendered as they arrive and dropped.
+    The rows can be rendered only once: rendering again gives the head
+    only. Other reads (rows, copy, ...) only see the sample rows.
+    render(start, stop) and pages() read their rows from the
+    iterable, leaving the rows after them to be read.
+    Cells past the measured columns are dropped. With given widths, rows
+    with more cells than widths raise a ValueError while rendering.
+    """
+
+    def __init__(self, head=None, rows=(), widths=None, sample=100,
+                 **kwargs):
+        """
+        Keyword arguments:
+            head        -- List of column headings (default None).
+            rows        -- Iterable of lists containing cell data
+                           (default ()).
+            widths      -- List of the width of each column, same as
+                           Table.column_widths (default None: measured).
+            sample      -- Number of rows read to measure the column
+                           widths, if widths is None (default 100).
+            kwargs      -- Passed on to Table() (max_width, fill, col_sep,
+                           ...).
+        """
+        super().__init__(**kwargs)
+        if sample < 0:
+            raise ValueError('`sample` cannot be less then 0')
+        if head is not None:
+            self.add_head(data=list(head))
+        self._rows = iter(rows)
+        self._measured = widths is None
+        self._streaming = False
+        if widths is None:
+            self.extend_rows(islice(self._rows, sample))
+            widths = self._layout.widths
+        elif head is not None and len(self._head) > len(widths):
+            raise ValueError(f'widths={widths} has less columns then head.')
+        self._layout = _FixedLayout(self, widths)
+
+    def __repr__(self):
+        """Representation of this object. Nr of columns are added."""
+        return f'<StreamingTable: {len(self._layout.widths)} columns>'
+
+    @property
+    def rows(self):
+        """
+        Iterable object, returning the sample rows. While rendering, the
+        rows read from the iterable follow (see _stream_rows).
+        """
+        if self._streaming:
+            return self._stream_rows()
+        return iter(self._data)
+
+    def _stream_rows(self):
+        """
+        Returns the sample rows and then the rows read from the iterable,
+        each once. The sample rows are dropped.
+        """
+        sample = list(self._data)[::-1]
+        self._data = _STORAGES[self.storage](self)
+        n = len(self._layout.widths)
+        new = self._new_cell
+        while sample:
+            yield sample.pop()
+        for row in self._rows:
+            if not isinstance(row, (list, tuple, set, str)):
+                raise TypeError(f'data={row} not supported.')
+            if len(row) > n:
+                if not self._measured:
+                    raise ValueError(f'data={row} has more then {n} '
+                                     'columns.')
+                row = list(row)[:n]
+            cells = [new(d) for d in row]
+            yield cells + [new() for _ in range(n - len(cells))]
+
+    def _window(self, rows):
+        """
+        A Table of the given rows read from the iterable, with the head,
+        settings and column widths of this table.
+        """
+        T = self.copy()
+        T.remove_rows(slice(None), removehead=False)
+        T.extend_rows([[c._value for c in row] for row in rows])
+        T._layout = _FixedLayout(T, self._layout.widths)
+        return T
+
+    def _select_lines(self, format, start, stop, widths, workers):
+        """
+        Renders the rows read from the iterable (see rows). With start or
+        stop, the rows before start are read and dropped, and the rows
+        after stop are left to be read.
+        """
+        if start is not None or stop is not None:
+            if (start or 0) < 0 or (stop or 0) < 0:
+                raise ValueError('Rows of a StreamingTable are counted '
+                                 'from the first row only.')
+            rows = islice(self._stream_rows(), start, stop)
+            return self._window(rows)._select_lines(format, None, None,
+                                                    widths, workers)
+        return self._stream_lines(format, widths, workers)
+
+    def _stream_lines(self, format, widths, workers):
+        """The lines of _select_lines, for all rows."""
+        self._streaming = True
+        try:
+            yield from super()._select_lines(format, None, None, widths,
+                                             workers)
+        finally:
+            self._streaming = False
+
+    def pages(self, page_height, format='text', widths='table'):
+        """
+        Iterate over the pages of the table (see Table.pages), reading
+        page_height rows from the iterable for each page.
+        """
+        if page_height < 1:
+            raise ValueError('`page_height` cannot be less then 1')
+        rows = self._stream_rows()
+        while True:
+            page = list(islice(rows, page_height))
+            if not page:
+                return
+            yield '\n'.join(self._window(page)._render_lines(format,
+                                                             widths=widths))
+
+    def iter_lines(self):
+        """
+        Iterate over the lines of the table, rendering each row as soon as
+        it is read.
+        """
+        yield from self._iter_lines(self._stream_rows(), block_size=1)
 
 
 if __name__ == '__main__':
     print('This module is supposed to be imported!')
 # TODO:
 # - Except any data=... on add_*(), but convert too list if not a list?
-# - Make logging more efficient...
 # Wishlist:
 # - Nested tables side by side won't line row by row... This leaves room for
 #   discussion. At the end, it's a cell containing a table, not a splitted
@@ -0,0 +1,268 @@
+"""
+Benchmarks of the hot paths of tables.py: rendering, column widths,
+adding and removing rows/columns, copying and trunking cells.
+Run with: python -m tables_bench [--scale 0.1] [--save base.json]
+          [--compare base.json]
+Reports the time (best of --repeat runs), peak memory and retained
+memory blocks of each benchmark, and the change against a saved baseline.
+"""
+
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from tables import Table, _Cell
+
+__all__ = ['BENCHMARKS', 'measure', 'run', 'main']
+
+_WORKERS = os.cpu_count() or 1
+
+_TEXT = ('Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do '
+         'eiusmod tempor incididunt ut labore et dolore magna aliqua.')
+
+
+def _tall(scale, **kwargs):
+    """A Table of many short rows, of mixed values."""
+    n = max(int(20000 * scale), 1)
+    return Table(data=[[i, f'row {i}', i / 7, None] for i in range(n)],
+                 **kwargs)
+
+
+def _large(scale):
+    """A Table of 1M cells (at scale 1), 10 columns of mixed values."""
+    n = max(int(100000 * scale), 1)
+    return Table(data=[[i, f'row {i}', i / 7, None, 'x' * (i % 13), -i,
+                        f'{i:x}', i * 1e6, 'value', i % 3]
+                       for i in range(n)])
+
+
+def _wide(scale):
+    """A Table of a few rows with many columns."""
+    n = max(int(400 * scale), 1)
+    return Table(data=[[f'{i}.{j}' for j in range(n)] for i in range(20)])
+
+
+def _nested(scale):
+    """A Table of Tables nested a few levels deep, with rows at each level."""
+    rows = max(int(50 * scale), 1)
+    T = Table(data=[['leaf', 1.5, None]])
+    for depth in range(6):
+        T = Table(data=[[f'level {depth}', T]] +
+                       [[i, f'value {i}'] for i in range(rows)])
+    return T
+
+
+def _multiline(scale):
+    """A Table of long, multiline text trunked to a small max_width."""
+    n = max(int(2000 * scale), 1)
+    return Table(data=[[i, f'{_TEXT}\n{_TEXT[:i % 40]}', _TEXT]
+                       for i in range(n)], max_width=60)
+
+
+def _numeric(scale):
+    """A Table of numeric columns, trunked to narrow widths."""
+    n = max(int(20000 * scale), 1)
+    return Table(data=[[i, i * 1e9 / 7, -i / 3, i ** 3, 1 / (i + 1)]
+                       for i in range(n)], max_width=40)
+
+
+def _max_width(scale):
+    """A tall Table with long values, trunked to max_width."""
+    T = _tall(scale / 4, max_width=40)
+    T.add_column(data=[_TEXT] * T.row_count)
+    return T
+
+
+def _cells(scale):
+    """Cells of each kind of value, with a width to trunk them to."""
+    n = max(int(5000 * scale), 1)
+    values = [_TEXT, 'short', 123456789, 3.14159265358979, -2e64, None,
+              [1, 2, 3], 'multi\nline\ntext']
+    return [_Cell(values[i % len(values)]) for i in range(n)]
+
+
+def _empty_cells(scale):
+    """Builds a Table of 1000 columns of empty cells (1M cells at scale 1)."""
+    return Table(rows=max(int(1000 * scale), 1), columns=1000)
+
+
+def _trunk(cells):
+    for i, c in enumerate(cells):
+        c._trunk(5 + i % 20)
+
+
+def _add_rows(T):
+    for i in range(1000):
+        T.add_row(data=[i, 'new row'])
+
+
+def _add_columns(T):
+    for i in range(10):
+        T.add_column(head=f'column {i}')
+
+
+def _add_columns_at_once(T):
+    T.add_columns([[f'column {i}'] * T.row_count for i in range(10)])
+
+
+def _tail(scale):
+    """An empty Table keeping the last rows, and the number to add."""
+    n = max(int(20000 * scale), 1)
+    return Table(max_rows=max(n // 20, 1)), n
+
+
+def _add_rows_evicting(tail):
+    T, n = tail
+    for i in range(n):
+        T.add_row(data=[i, 'x' * (i % 97)])
+
+
+def _remove_rows(T):
+    for i in range(0, min(1000, T.row_count // 2)):
+        T.remove_row(i)
+
+
+# name: (setup, benchmark), each setup gets the scale
+BENCHMARKS = {
+    'str/tall': (_tall, str),
+    'str/wide': (_wide, str),
+    'str/nested': (_nested, str),
+    'str/multiline': (_multiline, str),
+    'str/numeric': (_numeric, str),
+    'str/max_width': (_max_width, str),
+    'render/workers': (_tall, lambda T: T.render(workers=2)),
+    # The same 1M cells, rendered in this process and by a worker per CPU
+    'render/large/serial': (_large, lambda T: T.render()),
+    'render/large/workers': (_large,
+                             lambda T: T.render(workers=_WORKERS)),
+    'column_widths/tall': (_tall, lambda T: T.column_widths),
+    'column_widths/wide': (_wide, lambda T: T.column_widths),
+    'column_widths/nested': (_nested, lambda T: T.column_widths),
+    'add_row/tall': (_tall, _add_rows),
+    'add_row/max_rows': (_tail, _add_rows_evicting),
+    'add_column/tall': (_tall, _add_columns),
+    'add_columns/tall': (_tall, _add_columns_at_once),
+    'remove_row/tall': (_tall, _remove_rows),
+    'remove_rows/tall': (_tall,
+                         lambda T: T.remove_rows(where=lambda r: r[0] % 2)),
+    'copy/tall': (_tall, lambda T: T.copy()),
+    'copy/nested': (_nested, lambda T: T.copy()),
+    '_trunk/cells': (_cells, _trunk),
+    # Peak memory of the cells, about peak / 1M per cell
+    'memory/cells': (lambda scale: scale, _empty_cells),
+}
+
+
+def measure(setup, benchmark, scale=1.0, repeat=5):
+    """
+    Returns a dict with the best time of repeat runs (seconds), the peak
+    memory (bytes) and the number of memory blocks still allocated after
+    one run (retained, not all blocks allocated during the run).
+    Every run gets a new object from setup, setup isn't measured.
+    """
+    times = []
+    for __ in range(repeat):
+        obj = setup(scale)
+        gc.collect()
+        start = time.perf_counter()
+        benchmark(obj)
+        times.append(time.perf_counter() - start)
+    obj = setup(scale)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    benchmark(obj)
+    __, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, 'filename')
+    retained = sum(s.count_diff for s in stats if s.count_diff > 0)
+    return {'time': min(times), 'peak': peak, 'retained': retained}
+
+
+def run(names=None, scale=1.0, repeat=5):
+    """
+    Returns the results of measure() of each benchmark, by name.
+    Keyword arguments:
+    names   -- Names, or parts of names, of the benchmarks to run
+               (default None: all).
+    scale   -- Size of the tables, relative to the default (default 1.0).
+    repeat  -- Number of timed runs of each benchmark (default 5).
+    """
+    results = {}
+    for name, (setup, benchmark) in BENCHMARKS.items():
+        if names and not any(n in name for n in names):
+            continue
+        results[name] = measure(setup, benchmark, scale, repeat)
+    return results
+
+
+def _report(results, baseline=None):
+    """Returns a Table of the results, compared to the baseline results."""
+    T = Table(row_sep='')
+    head = ['benchmark', 'time (ms)', 'peak (KiB)', 'retained blocks']
+    if baseline is not None:
+        head += ['baseline (ms)', 'change']
+    T.add_head(data=head)
+    for name, r in results.items():
+        row = [name, f'{r["time"] * 1000:.2f}', f'{r["peak"] / 1024:.0f}',
+               r['retained']]
+        if baseline is not None:
+            if name in baseline:
+                base = baseline[name]['time']
+                change = (r['time'] - base) / base * 100 if base else 0
+                row += [f'{base * 1000:.2f}', f'{change:+.1f}%']
+            else:
+                row += ['', 'new']
+        T.add_row(data=row)
+    return T
+
+
+def main(argv=None):
+    """
+    Runs the benchmarks, prints the report and saves or compares against
+    a baseline. Returns 1 when a benchmark is slower than --max-slowdown
+    percent compared to the baseline, else 0.
+    """
+    parser = argparse.ArgumentParser(prog='python -m tables_bench',
+                                     description=__doc__.splitlines()[1])
+    parser.add_argument('names', nargs='*',
+                        help='run only benchmarks with one of these in '
+                             'their name')
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='size of the tables (default 1.0)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='timed runs of each benchmark (default 5)')
+    parser.add_argument('--save', metavar='JSON',
+                        help='save the results as a baseline')
+    parser.add_argument('--compare', metavar='JSON',
+                        help='compare the results to a saved baseline')
+    parser.add_argument('--max-slowdown', type=float, metavar='PERCENT',
+                        help='fail when slower than the baseline by more')
+    args = parser.parse_args(argv)
+    results = run(args.names, args.scale, args.repeat)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as fp:
+            baseline = json.load(fp)['results']
+    print(_report(results, baseline))
+    if args.save:
+        with open(args.save, 'w') as fp:
+            json.dump({'scale': args.scale, 'python': sys.version,
+                       'results': results}, fp, indent=2)
+    if baseline is not None and args.max_slowdown is not None:
+        for name, r in results.items():
+            base = baseline.get(name, {}).get('time')
+            if base and (r['time'] - base) / base * 100 > args.max_slowdown:
+                return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,8 +1,13 @@
 #!/usr/bin/python3
 
+import asyncio
+import json
 import unittest
+from unittest import mock
+import tables
 from tables import Table
-from itertools import product
+from itertools import islice, product
+from io import StringIO
 
 
 # TODO:
@@ -178,6 +183,13 @@ class TestTable(unittest.TestCase):
         for v in self.types.values():
             for x in v:
                 self.assertIsInstance(Table(fill=x), Table, msg=f'fill={x}')
+        # Changing the fill widens the empty cells
+        for storage in ('rows', 'columnar'):
+            T = Table(data=[['a', None], ['bb', 'c']], storage=storage)
+            self.assertEqual(T.column_widths, [3, 3])
+            T.fill = 'a very long fill'
+            self.assertEqual(T.column_widths, [3, 16], msg=storage)
+            self.assertIn('a very long fill', str(T))
 
     def test__len__(self):
         # expect = fill
@@ -258,6 +270,570 @@ class TestTable(unittest.TestCase):
             with self.assertRaises(ValueError, msg=f'fill={data}'):
                 T.max_width = max_width
 
+    def test_column_widths(self):
+        T = Table(rows=2, columns=2)
+        self.assertEqual(T.column_widths, [3, 3])
+        T.add_row(data=['helloworld', 'hey'])
+        self.assertEqual(T.column_widths, [11, 3])
+        # Changing a cell value invalidates the cached widths
+        T._data[0][1].value = 'a longer value'
+        self.assertEqual(T.column_widths, [11, 14])
+        T.col_sep = '/'
+        self.assertEqual(T.column_widths, [11, 14])
+        T.col_sep = ''
+        self.assertEqual(T.column_widths, [10, 14])
+        T.max_width = 20
+        self.assertEqual(T.column_widths, [9, 10])
+        T.remove_row(index=2)
+        self.assertEqual(T.column_widths, [3, 14])
+        # Changes in a nested table propagate to the parent table
+        N = Table(data=[['abc']])
+        T.max_width = None
+        T.add_column(data=[N])
+        self.assertEqual(T.column_widths, [3, 14, 3])
+        N.add_row(data=['0123456789'])
+        self.assertEqual(T.column_widths, [3, 14, 10])
+        self.assertEqual(len(T), sum(T.column_widths) + 2)
+        # Returned widths are a copy
+        T.column_widths.append(1)
+        self.assertEqual(len(T.column_widths), 3)
+
+    def test_min_widths(self):
+        data = [['a' * 20, 'b' * 20, 'c' * 20, 'd' * 20]]
+        T = Table(data=data, max_width=49)
+        self.assertEqual(T.column_widths, [10, 11, 11, 11])
+        # Columns with a higher priority are trunked last
+        T.priorities = [1, None, 0, 2]
+        self.assertEqual(T.column_widths, [17, 3, 3, 20])
+        # Columns are not trunked below their minimum
+        T.min_widths = [None, 10]
+        self.assertEqual(T.column_widths, [10, 10, 3, 20])
+        T.min_widths = [15, 15, 15, 15]
+        self.assertEqual(T.column_widths, [15, 15, 15, 15])
+        self.assertEqual(T.copy().column_widths, T.column_widths)
+        T.min_widths = T.priorities = None
+        self.assertEqual(T.column_widths, [10, 11, 11, 11])
+        with self.assertRaises(TypeError):
+            T.priorities = ['high']
+        T.max_width = 18
+        with self.assertRaises(ValueError):
+            T.min_widths = [10]
+        self.assertIsNone(T.min_widths)
+        # Same widths as trunking the first widest column one at a time
+        T = Table(data=[[str(i) * i for i in range(1, 100, 7)]])
+        M = T.column_widths
+        T.max_width = 150
+        while sum(M) > 150 - 2 * (len(M) - 1):
+            M[M.index(max(M))] -= 1
+        self.assertEqual(T.column_widths, M)
+
+    def test_width_strategy(self):
+        for storage in ('rows', 'columnar'):
+            data = [['a', 1], ['bb', 2], ['a much longer value', 3]]
+            T = Table(data=data, storage=storage, width_strategy='sample',
+                      sample_size=2)
+            self.assertEqual(T.column_widths, [3, 3])
+            self.assertEqual(T.copy().column_widths, [3, 3])
+            self.assertEqual(T.view(columns=0).column_widths, [3])
+            # Wider cells past the sample are trunked
+            self.assertEqual(str(T).splitlines()[-1], 'a..| 3  ')
+            T.add_row(data=['another long value'])
+            self.assertEqual(T.column_widths, [3, 3])
+            T.add_row(index=0, data=['first'])
+            self.assertEqual(T.column_widths, [6, 3])
+            T.sample_size = 3
+            self.assertEqual(T.column_widths, [6, 3])
+            T.width_strategy = 'exact'
+            self.assertEqual(T.column_widths, [20, 3])
+            with self.assertRaises(ValueError):
+                T.width_strategy = 'guess'
+            with self.assertRaises(ValueError):
+                T.sample_size = 0
+            # Rows past the sample adding columns are not dropped
+            T = Table(data=[['a', 'b'], ['c', 'd']], storage=storage,
+                      width_strategy='sample', sample_size=1)
+            self.assertEqual(T.column_widths, [3, 3])
+            T.add_row(data=['x', 'y', 'zzzz'])
+            self.assertEqual(T.column_widths, [3, 3, 3])
+            self.assertEqual(str(T).splitlines()[-1], 'x  | y  | z..')
+
+    def test_streaming(self):
+        data = [['a', 1], ['bb', 2], ['a much longer value', 3]]
+        read = []
+
+        def rows():
+            for row in data:
+                read.append(row)
+                yield row
+        for storage in ('rows', 'columnar'):
+            read.clear()
+            S = tables.StreamingTable(['x', 'y'], rows(), sample=2,
+                                      storage=storage)
+            self.assertEqual(len(read), 2)
+            self.assertEqual(S.column_widths, [3, 3])
+            lines = S.iter_lines()
+            self.assertEqual(list(islice(lines, 5)),
+                             ['x  | y  ', '===+====', 'a  | 1  ',
+                              '---+----', 'bb | 2  '])
+            self.assertEqual(len(read), 2)
+            # Rows past the sample are trunked to the sampled widths
+            self.assertEqual(list(lines), ['---+----', 'a..| 3  '])
+            self.assertEqual(len(read), 3)
+            self.assertEqual(S.row_count, 0)
+            # Rows are read once
+            self.assertEqual(str(S), 'x  | y  \n===+====')
+        # Same as a Table, when all rows are sampled
+        T = Table(data=data)
+        T.add_head(data=['x', 'y'])
+        S = tables.StreamingTable(['x', 'y'], iter(data), sample=3)
+        self.assertEqual(str(S), str(T))
+        # Given widths, other formats and short rows
+        S = tables.StreamingTable(['x', 'y'], iter([[1], [2, 3]]),
+                                  widths=[4, 4], fill='-')
+        self.assertEqual(S.render('csv'), 'x,y\n1,\n2,3')
+        self.assertEqual(len(S.render().splitlines()), 2)
+        S = tables.StreamingTable(None, iter([[1, Table(data=[[1, 2]])]]),
+                                  widths=[3, 8])
+        self.assertEqual(str(S), '1  | 1  | 2  ')
+        with self.assertRaises(ValueError):
+            str(tables.StreamingTable(None, iter([[1, 2, 3]]),
+                                      widths=[3, 3]))
+        # Cells past the sampled columns are dropped
+        S = tables.StreamingTable(None, iter([[1, 2], [3, 4, 5]]), sample=1)
+        self.assertEqual(S.render('csv'), '1,2\n3,4')
+        # Reading the rows or a copy keeps the sample
+        S = tables.StreamingTable(['x', 'y'], iter(data), sample=2)
+        self.assertEqual([[c.value for c in r] for r in S.rows],
+                         [['a', 1], ['bb', 2]])
+        self.assertEqual(S.copy().row_count, 2)
+        self.assertEqual(S.row_count, 2)
+        self.assertEqual(S.render('csv').splitlines()[-1],
+                         'a much longer value,3')
+        # Windows and pages read the rows from the iterable
+        rows = [[1, 'x'], [2, 'y'], [3, 'z'], [4, 'w']]
+        S = tables.StreamingTable(['a', 'b'], iter(rows), sample=1)
+        self.assertEqual(S.render('csv', start=1, stop=3), 'a,b\n2,y\n3,z')
+        self.assertEqual(S.render('csv'), 'a,b\n4,w')
+        S = tables.StreamingTable(['a', 'b'], iter(rows), sample=1)
+        self.assertEqual(list(S.pages(3, format='csv')),
+                         ['a,b\n1,x\n2,y\n3,z', 'a,b\n4,w'])
+        S = tables.StreamingTable(['a', 'b'], iter(rows), sample=1)
+        self.assertEqual([p.splitlines()[2] for p in S.pages(2)],
+                         ['1  | x  ', '3  | z  '])
+        with self.assertRaises(ValueError):
+            S.render(start=-1)
+        with self.assertRaises(ValueError):
+            tables.StreamingTable(['x', 'y'], widths=[3])
+        with self.assertRaises(TypeError):
+            str(tables.StreamingTable(None, iter([1]), widths=[3]))
+
+    def test_width_workers(self):
+        data = [[i, 'x' * i, None, 'two\nlines'] for i in range(10)]
+        data[4][2] = Table(data=[['nested', 'table']])
+        for storage in ('rows', 'columnar'):
+            T = Table(data=data, fill='empty', storage=storage)
+            widths = T.column_widths
+            P = Table(data=data, fill='empty', storage=storage,
+                      width_workers=2, width_threshold=16)
+            with mock.patch.object(tables, '_BLOCK', 3):
+                self.assertEqual(P.column_widths, widths)
+                self.assertEqual(str(P), str(T))
+                P.width_strategy = 'sample'
+                P.sample_size = 4
+                self.assertEqual(P.column_widths, [3, 4, 6, 5])
+            # Below the threshold the widths are measured in this process
+            P.width_threshold = 41
+            with mock.patch.object(tables, '_parallel_widths') as measure:
+                P.width_strategy = 'exact'
+                self.assertEqual(P.column_widths, widths)
+                measure.assert_not_called()
+            self.assertEqual(P.copy().width_workers, 2)
+        with self.assertRaises(ValueError):
+            Table(width_workers=0)
+        with self.assertRaises(ValueError):
+            Table(width_threshold=-1)
+
+    def test_max_rows(self):
+        T = Table(max_rows=3)
+        T.add_head(data=['n', 'value'])
+        self.assertEqual((T.storage, T.max_rows, T.evict),
+                         ('ring', 3, 'oldest'))
+        for i, value in enumerate(['a', 'a much longer value', 'b', 'c']):
+            T.add_row(data=[i, value])
+        self.assertEqual([r[0].value for r in T.rows], [1, 2, 3])
+        self.assertEqual(T.column_widths, [3, 19])
+        # Evicting the widest row narrows the column
+        T.extend_rows([[4, 'd'], [5, 'e']])
+        self.assertEqual([r[0].value for r in T.rows], [3, 4, 5])
+        self.assertEqual(T.column_widths, [3, 5])
+        # Changed cells, fill and nested Tables are measured again
+        next(T.rows)[1].value = 'a wide value'
+        T.fill = 'empty fill'
+        T.add_row(data=[6])
+        self.assertEqual(T.column_widths, [3, 10])
+        N = Table(data=[['x']])
+        T.add_row(data=[7, N])
+        N.add_row(data=['a nested value'])
+        self.assertEqual(T.column_widths, [3, 14])
+        P = Table(data=[[c.value for c in row] for row in T.rows])
+        P.add_head(data=['n', 'value'])
+        self.assertEqual(str(T), str(P))
+        self.assertEqual(str(T.copy()), str(T))
+        self.assertEqual(T.copy().max_rows, 3)
+        self.assertEqual(str(T.view(rows=[1, 2])), str(P.view(rows=[1, 2])))
+        T.remove_rows(slice(0, 2))
+        self.assertEqual((T.row_count, T.column_widths), (1, [3, 14]))
+        T.add_columns([[1, 2, 3, 4]])
+        self.assertEqual([r[2].value for r in T.rows], [2, 3, 4])
+        self.assertEqual(Table(rows=5, columns=2, max_rows=2).row_count, 2)
+        # Rows inserted first are kept, the oldest other row is evicted
+        T = Table(data=[['a'], ['b']], max_rows=2)
+        T.add_row(index=0, data=['new'])
+        self.assertEqual([r[0].value for r in T.rows], ['new', 'b'])
+        T.add_row(index=1, data=['c'])
+        self.assertEqual([r[0].value for r in T.rows], ['c', 'b'])
+        # An empty ring has no columns left
+        T.remove_rows(where=lambda row: True, removehead=False)
+        self.assertEqual((T.column_count, T.column_widths), (0, []))
+        T.add_row(data=['x', 'y'])
+        self.assertEqual(T.column_widths, [3, 3])
+        with self.assertRaises(ValueError):
+            Table(max_rows=0)
+        with self.assertRaises(ValueError):
+            Table(storage='ring')
+        with self.assertRaises(ValueError):
+            Table(max_rows=2, storage='columnar')
+        with self.assertRaises(ValueError):
+            Table(max_rows=2, evict='newest')
+
+    def test_cell(self):
+        T = Table(rows=2, columns=2, fill='x')
+        c = next(T.cells)
+        self.assertFalse(hasattr(c, '__dict__'))
+        self.assertEqual(c.value, 'x')
+        # Fill is read from the table
+        T.fill = 'empty'
+        self.assertEqual(c.value, 'empty')
+        self.assertEqual(T.column_widths, [6, 5])
+        c.value = 'a long value'
+        self.assertEqual(c.lines(), ['a long value'])
+        self.assertEqual(c.lines(6), ['a ', 'long ', 'value '])
+        with self.assertRaises(ValueError):
+            c.lines(2)
+        # Copies contain values, not cells
+        for C in (T.copy(rows=0), T.copy(columns=0)):
+            self.assertEqual([x.value for x in C.cells][0], 'a long value')
+        # Rendered lines are kept until the value or fill changes
+        self.assertIs(c.lines(6), c.lines(6))
+        c.value = 1234567
+        self.assertEqual((c.lines(), len(c)), (['1234567'], 7))
+        e = list(T.cells)[-1]
+        self.assertEqual((e.lines(), len(e)), (['empty'], 5))
+        T.fill = 'no'
+        self.assertEqual((e.lines(), len(e)), (['no'], 2))
+        # Containers can change in place, and are rendered every time
+        c.value = [1]
+        c.value.append(2)
+        self.assertEqual((c.lines(), len(c)), (['[1, 2]'], 6))
+
+    def test_format_numbers(self):
+        values = [0, -0.0, 0.5, 2.5, -7, 9.5, 99.5, 999.4999, 1234567,
+                  -1234567, 1/7, 1e15, 999999999999999.9, 2e32, 2**60,
+                  True, False, *self.types['positive_float'],
+                  *self.types['negative_float']]
+        for i in (None, 4, 5, 8, 12, 20):
+            self.assertEqual(
+                [(type(v), v) for v in tables._format_numbers(values, i)],
+                [(type(v), v) for v in
+                 (tables._trunk_number(v, i) for v in values)],
+                msg=f'i={i}')
+        # Numeric columns are trunked at once, with the same output
+        T = Table(data=[[v, str(v)] for v in values])
+        T.max_width = 16
+        expect = str(T)
+        with mock.patch('tables.np', None):
+            self.assertEqual(str(Table(data=[[v, str(v)] for v in values],
+                                       max_width=16)), expect)
+
+    def test_nested(self):
+        G = Table(data=[['grand', 'child']])
+        C = Table(data=[[G, 'child']])
+        T = Table(data=[[C, 'parent']])
+        T.max_width = len(T) - 2
+        first = str(T)
+        # Rendering again keeps the nested tables as they are
+        version = C._version, G._version
+        self.assertEqual(str(T), first)
+        self.assertEqual((C._version, G._version), version)
+        cell = next(T.cells)
+        self.assertIs(cell.lines(T.column_widths[0]),
+                      cell.lines(T.column_widths[0]))
+        # Changes of a nested table are rendered by all its parents
+        next(G.cells).value = 'GRAND'
+        self.assertEqual(str(T), first.replace('grand', 'GRAND'))
+
+    def test_storage(self):
+        with self.assertRaises(ValueError):
+            Table(storage='cells')
+        tables = [Table(data=[[1, 'a'], [2.5, 'b\nc']], fill='-',
+                        storage=storage)
+                  for storage in ('rows', 'columnar')]
+        self.assertEqual(tables[1].storage, 'columnar')
+        for T in tables:
+            T.add_head(data=['x', 'y'])
+            T.add_row(data=['longer value', None, 'new'])
+            T.add_row(index=0, data=[Table(data=[[1, 2]])])
+            T.add_column(index=1, head='z', data=['a', 'b', 'c', 'd', 'e'])
+            T.remove_column(index=[0, 3])
+            T.remove_row(index=2)
+            T.remove_column(index=0, removehead=False)
+            T._data[0][1].value = 'changed'
+        R, C = tables
+        self.assertEqual(str(R), str(C))
+        self.assertEqual(R.column_widths, C.column_widths)
+        self.assertEqual((R.row_count, R.column_count),
+                         (C.row_count, C.column_count))
+        self.assertEqual([[c.value for c in r] for r in R.rows],
+                         [[c.value for c in r] for r in C.rows])
+        # Column data longer than the table adds rows below that column
+        for storage in ('rows', 'columnar'):
+            T = Table(data=[[1, 2]], storage=storage)
+            T.add_column(data=['a', 'b'])
+            column = list(T.columns)[-1]
+            self.assertEqual([c.value for c in column], ['a', 'b'])
+            C = T.copy()
+            self.assertEqual(C.storage, storage)
+            self.assertEqual(str(C), str(T))
+            T.remove_row(index=[0, 1])
+            self.assertEqual((T.row_count, T.column_count), (0, 0))
+            T.add_row(data=['x'])
+            self.assertEqual(T.column_count, 1)
+
+    def test_from_records(self):
+        records = [{'a': 1, 'b': 'x'}, {'b': 'long value', 'c': None}]
+        T = Table.from_records(records, fill='-', storage='columnar')
+        self.assertEqual([h.value for h in T.head], ['a', 'b', 'c'])
+        self.assertEqual([[c.value for c in r] for r in T.rows],
+                         [[1, 'x', '-'], ['-', 'long value', '-']])
+        self.assertEqual((T.fill, T.storage), ('-', 'columnar'))
+        self.assertEqual(Table.from_records([]).column_count, 0)
+        with self.assertRaises(TypeError):
+            Table.from_records([[1, 2]])
+
+    def test_from_columns(self):
+        T = Table.from_columns({'a': [1, 2, 3], 'b': ['x']})
+        self.assertEqual([h.value for h in T.head], ['a', 'b'])
+        self.assertEqual([[c.value for c in r] for r in T.rows],
+                         [[1, 'x'], [2, ''], [3, '']])
+        self.assertEqual(str(T), str(Table.from_records(
+            [{'a': 1, 'b': 'x'}, {'a': 2}, {'a': 3}])))
+        with self.assertRaises(TypeError):
+            Table.from_columns([[1, 2]])
+
+    def test_from_csv(self):
+        fp = StringIO('a,b\n1,x\n2,"y, z"\n')
+        T = Table.from_csv(fp)
+        self.assertEqual([h.value for h in T.head], ['a', 'b'])
+        self.assertEqual([[c.value for c in r] for r in T.rows],
+                         [['1', 'x'], ['2', 'y, z']])
+        T = Table.from_csv(['a;b', '1;2;3'], delimiter=';')
+        self.assertEqual((T.row_count, T.column_count), (1, 3))
+        self.assertEqual(Table.from_csv(StringIO('')).column_count, 0)
+
+    def test_iter_lines(self):
+        T = Table(rows=3, columns=3, fill='test')
+        T.add_head(data=['a', 'multi\nline', 'head'])
+        self.assertEqual('\n'.join(T.iter_lines()), str(T))
+        T.row_sep = ''
+        self.assertEqual(list(T.iter_lines()), str(T).splitlines())
+        self.assertEqual(list(Table().iter_lines()), [])
+        # Lines are rendered while iterating
+        T = Table(rows=1000, columns=3)
+        self.assertEqual(len(list(islice(T.iter_lines(), 10))), 10)
+
+    def test_render_to(self):
+        T = Table(rows=10, columns=3, fill='test')
+        T.add_head(data=['a', 'b', 'c'])
+        for chunk_size in (1, 3, 64):
+            fp = StringIO()
+            T.render_to(fp, chunk_size=chunk_size)
+            self.assertEqual(fp.getvalue(), str(T) + '\n')
+        fp = StringIO()
+        Table().render_to(fp)
+        self.assertEqual(fp.getvalue(), '')
+        with self.assertRaises(ValueError):
+            T.render_to(StringIO(), chunk_size=0)
+
+    def test_render(self):
+        N = Table(data=[['n1', 'n,2']])
+        T = Table(data=[[1, 'a|b\nc', None], [2.5, N, '<x>']], fill='-')
+        T.add_head(data=['x', 'y', 'z'])
+        self.assertEqual(T.render(), str(T))
+        self.assertEqual(T.render('text'), str(T))
+        C = Table.from_csv(StringIO(T.render('csv')))
+        self.assertEqual([[c.value for c in r] for r in C.rows],
+                         [['1', 'a|b\nc', ''], ['2.5', 'n1,"n,2"', '<x>']])
+        self.assertEqual(T.render('tsv').splitlines()[0], 'x\ty\tz')
+        self.assertEqual(json.loads(T.render('json')), {
+            'head': ['x', 'y', 'z'],
+            'rows': [[1, 'a|b\nc', None],
+                     [2.5, {'head': None, 'rows': [['n1', 'n,2']]}, '<x>']]})
+        self.assertEqual(json.loads(Table().render('json')),
+                         {'head': None, 'rows': []})
+        lines = T.render('html').splitlines()
+        self.assertEqual(lines[-3], '<tr><td>2.5</td><td><table><tbody><tr>'
+                         '<td>n1</td><td>n,2</td></tr></tbody></table></td>'
+                         '<td>&lt;x&gt;</td></tr>')
+        self.assertEqual(T.render('markdown').splitlines()[:3],
+                         ['| x | y | z |', '| --- | --- | --- |',
+                          '| 1 | a\\|b<br>c | - |'])
+        self.assertEqual(Table(rows=1, columns=2).render('markdown')
+                         .splitlines()[0], '|  |  |')
+        # Machine formats don't compute the column widths
+        T._changed()
+        T.render('csv')
+        self.assertIsNone(T._layout._natural)
+        fp = StringIO()
+        T.render_to(fp, chunk_size=1, format='json')
+        self.assertEqual(fp.getvalue(), T.render('json') + '\n')
+        with self.assertRaises(ValueError):
+            T.render('xml')
+        Table.add_format('lines', lambda T: (str(r[0]) for r in T.rows))
+        self.assertEqual(T.render('lines'), '1\n2.5')
+        del tables._RENDERERS['lines']
+        with self.assertRaises(TypeError):
+            Table.add_format('none', None)
+
+    def test_render_window(self):
+        T = Table(data=[[i, str(i) * i] for i in range(12)])
+        T.add_head(data=['n', 'value'])
+        lines = str(T).splitlines()
+        # Same widths as the whole table
+        self.assertEqual(T.render(start=2, stop=4).splitlines(),
+                         lines[:2] + lines[6:9])
+        self.assertEqual(T.render(start=0), str(T))
+        # Widths of the window only
+        W = T.render(start=2, stop=4, widths='window')
+        self.assertEqual(W, str(T.view(rows=[2, 3])))
+        self.assertEqual(T.render('csv', stop=2).splitlines(),
+                         ['n,value', '0,', '1,1'])
+        pages = list(T.pages(5))
+        self.assertEqual(len(pages), 3)
+        self.assertEqual(pages[2], T.render(start=10))
+        self.assertEqual(pages[1].splitlines()[2:],
+                         lines[2 + 5 * 2:2 + 10 * 2 - 1])
+        self.assertEqual(list(T.pages(5, widths='window'))[0],
+                         str(T.view(rows=range(5))))
+        self.assertEqual(list(Table().pages(5)), [])
+        with self.assertRaises(ValueError):
+            list(T.pages(0))
+        with self.assertRaises(ValueError):
+            T.render(start=1, widths='page')
+
+    def test_render_workers(self):
+        data = [[i, 'x' * i, None, i / 7] for i in range(10)]
+        data[3][2] = Table(data=[[1, 'two\nlines']])
+        T = Table(data=data, max_width=40, fill='-')
+        T.add_head(data=['a', 'b', 'c', 'd'])
+        # Blocks of rows are rendered by different workers
+        with mock.patch.object(tables, '_BLOCK', 4):
+            self.assertEqual(T.render(workers=2), str(T))
+            self.assertEqual(T.render(start=2, stop=7, workers=2),
+                             T.render(start=2, stop=7))
+            self.assertEqual(
+                T.render(start=2, stop=7, widths='window', workers=2),
+                T.render(start=2, stop=7, widths='window'))
+            T.row_sep = ''
+            T.col_sep = ''
+            self.assertEqual(T.render(workers=1), str(T))
+        self.assertEqual(T.render('csv', workers=2), T.render('csv'))
+        with self.assertRaises(ValueError):
+            T.render(workers=0)
+
+    def test_render_stats(self):
+        T = Table(data=[['1', 'a'], ['2', Table(data=[['x', 'y']])]])
+        emitted = []
+        with tables.render_stats(emitted.append) as stats:
+            lines = str(T).splitlines()
+            # Trunking the nested Table changes the widths of both Tables
+            self.assertEqual(stats['column_widths'], 4)
+            self.assertEqual(stats['trunk'], 8)
+            self.assertEqual(stats['nested'], 1)
+            self.assertEqual(stats['cache_misses'], 8)
+            self.assertEqual(stats['lines'], len(lines))
+            self.assertEqual(stats['bytes'], sum(len(x) + 1 for x in lines))
+            # Kept lines are used the second time, only the seperators
+            # are trunked again
+            T.render()
+            self.assertEqual(stats['column_widths'], 4)
+            self.assertEqual(stats['trunk'], 10)
+            self.assertEqual(stats['nested'], 1)
+            self.assertEqual(stats['cache_hits'], 4)
+            self.assertEqual(stats['lines'], 2 * len(lines))
+            self.assertGreaterEqual(stats['trunk_time'],
+                                    stats['nested_time'])
+        self.assertEqual(emitted, [stats])
+        # Nothing is recorded outside the block
+        T.add_row(data=[3, 'b'])
+        str(T)
+        self.assertEqual(stats['lines'], 2 * len(lines))
+
+    def test_async(self):
+        T = Table(data=[[i, 'x' * i] for i in range(10)], max_width=10)
+        T.add_head(data=['a', 'b'])
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def run():
+            task = asyncio.ensure_future(tick())
+            lines = [line async for line in T.aiter_lines(chunk_size=4)]
+            self.assertEqual(lines, list(T.iter_lines()))
+            # Other tasks ran while iterating
+            self.assertGreaterEqual(len(ticks), len(lines) // 4)
+            self.assertEqual(await T.arender(offload=True), str(T))
+            self.assertEqual(await T.arender('csv', chunk_size=1),
+                             T.render('csv'))
+            writer = mock.Mock()
+            writer.drain = mock.AsyncMock()
+            await T.arender_to(writer, chunk_size=8)
+            written = b''.join(c.args[0] for c in writer.write.call_args_list)
+            self.assertEqual(written.decode(), str(T) + '\n')
+            self.assertEqual(writer.drain.await_count,
+                             writer.write.call_count)
+            with self.assertRaises(ValueError):
+                await T.arender(chunk_size=0)
+            task.cancel()
+        asyncio.run(run())
+
+    def test_render_diff(self):
+        for storage in ('rows', 'columnar'):
+            T = Table(data=[['a', 'b'], ['c', 'd']], storage=storage)
+            T.add_head(data=['x', 'y'])
+            lines = str(T).splitlines()
+            self.assertEqual(T.render_diff(), list(enumerate(lines)))
+            self.assertEqual(T.render_diff(), [])
+            self.assertEqual(T.render_diff(full=True), list(enumerate(lines)))
+            # Only the changed line is returned
+            T._data[1][0].value = 'e'
+            self.assertEqual(T.render_diff(), [(4, str(T).splitlines()[4])])
+            # A wider column changes every line
+            T._data[0][1].value = 'wide'
+            changes = T.render_diff()
+            self.assertEqual(changes, list(enumerate(str(T).splitlines())))
+            # Removed lines are returned empty
+            T.remove_row(index=1)
+            self.assertEqual(T.render_diff(), [(3, None), (4, None)])
+            # Nested tables are rendered every time
+            N = Table(data=[['n']])
+            T.add_row(data=[N])
+            T.render_diff()
+            N._data[0][0].value = 'm'
+            self.assertEqual(T.render_diff(), [(4, str(T).splitlines()[4])])
+
     def test_add_head(self):
         # Starting with empty table (no head)
         expect = [
@@ -388,6 +964,72 @@ class TestTable(unittest.TestCase):
                                            msg=f'data={x}'):
                         T.add_row(data=x)
 
+    def test_extend_rows(self):
+        for storage in ('rows', 'columnar'):
+            A = Table(storage=storage)
+            B = Table(storage=storage)
+            A.add_head(data=['a', 'b'])
+            B.add_head(data=['a', 'b'])
+            data = [[1], ['long value', 2, 3], [], 'xy']
+            for row in data:
+                A.add_row(data=row)
+            B.extend_rows(iter(data))
+            self.assertEqual(str(A), str(B))
+            self.assertEqual(A.column_widths, B.column_widths)
+            self.assertEqual((B.row_count, B.column_count), (4, 3))
+            # Widths of appended rows are merged into the cached layout
+            B.extend_rows([['a much longer value']])
+            self.assertEqual(B.column_widths[0], 20)
+            self.assertEqual(B.column_widths, B.copy().column_widths)
+            B.extend_rows([])
+            self.assertEqual(B.row_count, 5)
+            T = Table(storage=storage)
+            T.extend_rows([[]])
+            self.assertEqual((T.row_count, T.column_count), (1, 1))
+            with self.assertRaises(TypeError):
+                T.extend_rows([1, 2])
+
+    def test_add_columns(self):
+        for storage in ('rows', 'columnar'):
+            columns = [[1, 2], ['long value'], [], 'xyz']
+            heads = ['a', None, 'c', 'd']
+            for index in (None, 0, 1):
+                A = Table(data=[['x', 'y'], ['z']], storage=storage)
+                B = A.copy()
+                A.add_head(data=['h', 'i'])
+                B.add_head(data=['h', 'i'])
+                for j, (column, head) in enumerate(zip(columns, heads)):
+                    A.add_column(index=None if index is None else index + j,
+                                 head=head, data=column)
+                B.add_columns(iter(columns), heads=heads, index=index)
+                self.assertEqual(str(A), str(B))
+                self.assertEqual((B.row_count, B.column_count), (3, 6))
+            # Heads are added when needed
+            T = Table(storage=storage)
+            T.add_columns([[], []], heads=[None, 'b'])
+            self.assertEqual((T.row_count, T.column_count), (1, 2))
+            self.assertEqual([h.value for h in T.head], ['', 'b'])
+            T.add_columns([])
+            self.assertEqual(T.column_count, 2)
+            with self.assertRaises(ValueError):
+                T.add_columns([[1]], heads=['a', 'b'])
+            with self.assertRaises(TypeError):
+                T.add_columns([1])
+            # Removing columns at once, also by slice
+            T = Table(data=[list(range(6))] * 2, storage=storage)
+            T.add_head(data=list('abcdef'))
+            T.remove_columns(slice(1, None, 2))
+            self.assertEqual([h.value for h in T.head], ['a', 'c', 'e'])
+            self.assertEqual([c.value for c in T.cells], [0, 2, 4] * 2)
+            T.remove_columns([0, 2])
+            T.remove_columns(slice(5, 9))
+            self.assertEqual([c.value for c in T.cells], [2, 2])
+            T.remove_columns(0, removehead=False)
+            self.assertEqual([c.value for c in T.cells], ['', ''])
+            self.assertEqual((T.column_count, next(T.head).value), (1, 'c'))
+            with self.assertRaises(TypeError):
+                T.view().add_columns([[1]])
+
     def test_add_column(self):
         # Starting with empty table
         expect = [
@@ -595,6 +1237,38 @@ class TestTable(unittest.TestCase):
                                            msg='index='+str(x)):
                         T.remove_row(index=x)
 
+    def test_remove_rows(self):
+        for storage in ('rows', 'columnar'):
+            for index, left in [(0, [1, 2, 3, 4, 5]),
+                                (slice(1, 4), [0, 4, 5]),
+                                (slice(None, None, 2), [1, 3, 5]),
+                                (range(4, 6), [0, 1, 2, 3]),
+                                ([5, 0, 1], [2, 3, 4]),
+                                ({2, 3}, [0, 1, 4, 5]),
+                                ([], [0, 1, 2, 3, 4, 5])]:
+                T = Table(data=[[i, 'x' * i] for i in range(6)],
+                          storage=storage)
+                T.remove_rows(index)
+                self.assertEqual([r[0].value for r in T.rows], left,
+                                 msg=f'index={index}')
+                self.assertEqual(T.column_widths, T.copy().column_widths)
+            T = Table(data=[[i, 'x' * i] for i in range(6)], storage=storage)
+            T.add_head(data=['n', 'x'])
+            T.remove_rows(where=lambda row: row[0] % 3 == 0)
+            self.assertEqual([r[1].value for r in T.rows],
+                             ['x', 'xx', 'xxxx', 'xxxxx'])
+            T.remove_rows(slice(None), removehead=False)
+            self.assertEqual((T.row_count, T.column_count), (0, 2))
+            T.remove_rows(where=bool)
+            with self.assertRaises(ValueError):
+                T.remove_rows()
+            with self.assertRaises(ValueError):
+                Table(rows=2).remove_rows(range(1, 3))
+            with self.assertRaises(ValueError):
+                T.remove_rows(0, where=bool)
+            with self.assertRaises(TypeError):
+                T.view().remove_rows(0)
+
     def test_remove_column(self):
         # TODO: Make sure the proper column is removed!
         # Starting with three rows and three columns
@@ -700,6 +1374,97 @@ class TestTable(unittest.TestCase):
                                          f' not a copy for fill={x}')
                                 )
 
+    def test_view(self):
+        for storage in ('rows', 'columnar'):
+            T = Table(data=[[1, 'a', 3], [4, 'b', 6], [7, 8, 9]],
+                      storage=storage)
+            T.add_head(data=['x', 'y', 'z'])
+            for (col, row) in product([None, 0, [2, 0], range(1, 3)],
+                                      repeat=2):
+                V = T.view(rows=row, columns=col)
+                C = T.copy(rows=row, columns=col)
+                self.assertEqual(str(V), str(C),
+                                 msg=f'view(rows={row},columns={col})')
+            # Cells are not copied, and changes show in the view
+            V = T.view(rows=[2, 0], columns=1)
+            self.assertIs(next(V.cells), T._data[0][1])
+            T._data[2][1].value = 'a long value'
+            T.fill = '-'
+            T.add_head(index=1, data=['Y'])
+            self.assertEqual([[c.value for c in r] for r in V.rows],
+                             [['a'], ['a long value']])
+            self.assertEqual([h.value for h in V.head], ['Y'])
+            self.assertEqual(V.column_widths, [12])
+            T._data[0][1].value = None
+            self.assertEqual(str(V).splitlines()[2].rstrip(), '-')
+            # Views are read-only
+            with self.assertRaises(TypeError):
+                V.add_row(data=[1])
+            with self.assertRaises(TypeError):
+                V.remove_column()
+            with self.assertRaises(IndexError):
+                T.view(rows=3)
+            M = V.materialize()
+            self.assertEqual(str(M), str(V))
+            self.assertEqual(M.storage, storage)
+            self.assertIsNot(next(M.cells), next(V.cells))
+            M.add_row(data=[1])
+            self.assertEqual(V.row_count, 2)
+            # Views of views
+            self.assertEqual(str(T.view(columns=[0, 1]).view(columns=1)),
+                             str(T.view(columns=1)))
+            # Views are not notified of changes, unless nested
+            self.assertEqual(len(T._parents), 0)
+            P = Table(data=[['view', V]])
+            self.assertEqual(len(T._parents), 1)
+            before = str(P)
+            T._data[0][1].value = 'changed'
+            self.assertNotEqual(str(P), before)
+            self.assertIn('changed', str(P))
+
+    def test__getitem__(self):
+        for storage in ('rows', 'columnar'):
+            T = Table(data=[[i, str(i) * i, i * i] for i in range(10)],
+                      storage=storage)
+            T.add_head(data=['n', 'name', 'sq'])
+            self.assertEqual((T[3, 'sq'], T[-1, 0], T[2, -2]), (9, 9, '22'))
+            V = T[2:5, ['name', 0]]
+            self.assertEqual([h.value for h in V.head], ['name', 'n'])
+            self.assertEqual([[c.value for c in r] for r in V.rows],
+                             [['22', 2], ['333', 3], ['4444', 4]])
+            self.assertIs(V._data.cell(0, 1), T._data[2][0])
+            self.assertEqual(str(T[1]), str(T.view(rows=1)))
+            self.assertEqual(str(T[:, 'sq']), str(T.view(columns=2)))
+            # Order and duplicates are kept
+            V = T[[5, 1, 5], [2, 2]]
+            self.assertEqual([[c.value for c in r] for r in V.rows],
+                             [[25, 25], [1, 1], [25, 25]])
+            V = T[[i % 3 == 0 for i in range(10)], 0]
+            self.assertEqual([r[0].value for r in V.rows], [0, 3, 6, 9])
+            self.assertEqual(T[::3][1:, 'name'][1, 0], '666666')
+            for key in (10, (0, 3), (-11, 0), ([True], 0), (0, 0, 0)):
+                with self.assertRaises(IndexError, msg=f'key={key}'):
+                    T[key]
+            with self.assertRaises(KeyError):
+                T[0, 'missing']
+            for key in ('n', 1.5, (None, 0)):
+                with self.assertRaises(TypeError, msg=f'key={key}'):
+                    T[key]
+
+    def test_bench(self):
+        import tables_bench
+        results = tables_bench.run(['str/', 'copy'], scale=0.001, repeat=1)
+        self.assertEqual(list(results), ['str/tall', 'str/wide', 'str/nested',
+                                         'str/multiline', 'str/numeric',
+                                         'str/max_width', 'copy/tall',
+                                         'copy/nested'])
+        for r in results.values():
+            self.assertEqual(set(r), {'time', 'peak', 'retained'})
+        baseline = {'str/tall': {'time': results['str/tall']['time'] * 2}}
+        report = str(tables_bench._report(results, baseline))
+        self.assertIn('-50.0%', report)
+        self.assertIn('new', report)
+
 
 if __name__ == '__main__':
     unittest.main()